@@ -0,0 +1,46 @@
+"""
+Compare the rich text spoiler splitter against the implementation it replaced.
+
+    python scripts/bench_spoiler_split.py [--repeat 5]
+
+Run from the repository root with the app's environment variables set (config is read on
+import).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from timeit import repeat
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "tests")]
+
+from legacy_spoiler_split import split_spoilers_in_rich_text_blocks as legacy_split  # noqa: E402
+from spoiler_payloads import large_rich_text  # noqa: E402
+
+from slack_extra.views.create_spoiler import split_spoilers_in_rich_text_blocks  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for paragraphs in (10, 500, 4000):
+        payload = large_rich_text(paragraphs)
+        size = len(json.dumps(payload)) / 1024
+        new = split_spoilers_in_rich_text_blocks(payload)
+        if json.dumps(new) != json.dumps(legacy_split(payload)):
+            sys.exit(f"Outputs differ for {paragraphs} paragraphs")
+        old_ms, new_ms = (
+            min(repeat(lambda: fn(payload), number=1, repeat=args.repeat)) * 1000
+            for fn in (legacy_split, split_spoilers_in_rich_text_blocks)
+        )
+        print(
+            f"{size:9.1f} KiB  old {old_ms:8.2f} ms  new {new_ms:7.2f} ms  ({old_ms / new_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from slack_extra.actions.create_mover import create_mover_handler
 from slack_extra.actions.edit_movers import edit_movers_handler
 from slack_extra.actions.view_spoiler import view_spoiler_handler
+from slack_extra.utils.middleware import instrument
 
 ACTIONS = [
     {"id": "view_spoiler", "handler": view_spoiler_handler},
@@ -11,4 +12,4 @@ ACTIONS = [
 
 def register_actions(app):
     for action in ACTIONS:
-        app.action(action["id"])(action["handler"])
+        app.action(action["id"])(instrument("action", action["id"])(action["handler"]))
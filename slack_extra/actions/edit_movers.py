@@ -9,7 +9,9 @@ from slack_bolt.async_app import AsyncAck
 from slack_bolt.async_app import AsyncRespond
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_extra.config import config
 from slack_extra.tables import MigrationConfig
+from slack_extra.utils.modals import open_loading_modal
 from slack_extra.utils.slack import is_admin
 
 
@@ -17,45 +19,61 @@ async def edit_movers_handler(
     ack: AsyncAck, client: AsyncWebClient, respond: AsyncRespond, body: dict
 ):
     await ack()
+    # The admin check and config lookup can outlast the trigger_id
+    loading = await open_loading_modal(
+        client, body["trigger_id"], "Edit Movers", push=True
+    )
 
-    user_id = body["user"]["id"]
+    try:
+        user_id = body["user"]["id"]
 
-    admin = await is_admin(user_id)
+        admin = await is_admin(user_id)
 
-    if admin:
-        configs = await MigrationConfig.objects()
-    else:
-        configs = await MigrationConfig.objects().where(
-            MigrationConfig.user_id == user_id
-        )
-    select = StaticSelect().action_id("config")
-    for config in configs:
-        select.add_option(Option(text=config.name, value=str(config.id)))
-
-    view = (
-        Modal()
-        .callback_id("edit_move")
-        .title("Edit Movers")
-        .add_block(Section(text="You can edit your existing auto move configs here!"))
-        .add_block(
-            (
-                Input()
-                .label("Select a config to edit")
-                .element(select)
-                .block_id("config")
+        if admin:
+            configs = await MigrationConfig.objects()
+        else:
+            configs = await MigrationConfig.objects().where(
+                MigrationConfig.user_id == user_id
+            )
+        select = StaticSelect().action_id("config")
+        for migration_config in configs:
+            select.add_option(
+                Option(text=migration_config.name, value=str(migration_config.id))
+            )
+
+        view = (
+            Modal()
+            .callback_id("edit_move")
+            .title("Edit Movers")
+            .add_block(
+                Section(text="You can edit your existing auto move configs here!")
             )
-            if configs
-            else (
-                Actions().add_element(
-                    Button()
-                    .text("No configs found! Create one?")
-                    .action_id("create_mover")
-                    .style("primary")
+            .add_block(
+                (
+                    Input()
+                    .label("Select a config to edit")
+                    .element(select)
+                    .block_id("config")
+                )
+                if configs
+                else (
+                    Actions().add_element(
+                        Button()
+                        .text("No configs found! Create one?")
+                        .action_id("create_mover")
+                        .style("primary")
+                    )
                 )
             )
-        )
-        .submit("Edit!")
-        .close("Back")
-    ).build()
+            .submit("Edit!")
+            .close("Back")
+        ).build()
 
-    await client.views_push(view=view, trigger_id=body["trigger_id"])
+        await loading.update(view)
+    except Exception:
+        # Don't leave the user on the placeholder; the error still reaches Bolt's logs
+        await loading.message(
+            f"oops, something went wrong! please ask <@{config.slack.maintainer_id}> about it.",
+            title="Edit Movers",
+        )
+        raise
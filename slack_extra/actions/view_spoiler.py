@@ -10,7 +10,12 @@ from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.tables import Spoiler
+from slack_extra.tables import SpoilerArchive
 from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.spoilers import cache_spoiler_modal
+from slack_extra.utils.spoilers import spoiler_clicks
+from slack_extra.utils.spoilers import spoiler_modals
+from slack_extra.utils.spoilers import unpack_spoiler_message
 
 
 async def view_spoiler_handler(
@@ -21,8 +26,41 @@ async def view_spoiler_handler(
     value = body["actions"][0]["value"]
     ts = body["message"]["ts"]
     channel = body["channel"]["id"]
+    spoiler_clicks.record(channel, ts, user_id)
+
+    modal = spoiler_modals.get((channel, ts))
+    if modal:
+        await client.views_open(trigger_id=body["trigger_id"], view=modal)
+        return
+
+    spoiler = (
+        await Spoiler.objects()
+        .where((Spoiler.channel == channel) & (Spoiler.message_ts == ts))
+        .first()
+    )
+    if spoiler:
+        modal = cache_spoiler_modal(
+            channel, ts, json.loads(spoiler.message), spoiler.user
+        )
+        await client.views_open(trigger_id=body["trigger_id"], view=modal)
+        return
+
+    archived = (
+        await SpoilerArchive.objects()
+        .where((SpoilerArchive.channel == channel) & (SpoilerArchive.message_ts == ts))
+        .first()
+    )
+    if archived:
+        modal = cache_spoiler_modal(
+            channel, ts, unpack_spoiler_message(archived.message), archived.user
+        )
+        await client.views_open(trigger_id=body["trigger_id"], view=modal)
+        return
+
     match value:
         case "metadata":
+            # Spoilers sent with `/se spoiler <text>` before they were stored in the DB only
+            # exist in the message metadata
             try:
                 message = await client.conversations_history(
                     oldest=ts,
@@ -90,43 +128,18 @@ async def view_spoiler_handler(
                 )
                 .close("Close")
             ).build()
+            spoiler_modals.set((channel, ts), modal)
             await client.views_open(trigger_id=body["trigger_id"], view=modal)
             return
 
         case "db":
-            spoiler = (
-                await Spoiler.objects()
-                .where((Spoiler.channel == channel) & (Spoiler.message_ts == ts))
-                .first()
+            await client.chat_postEphemeral(
+                channel=channel,
+                user=user_id,
+                text="oops, something went wrong fetching that message from the database!",
             )
-            if spoiler:
-                modal = {
-                    "type": "modal",
-                    "title": {"type": "plain_text", "text": "Spoiler 👀"},
-                    "close": {"type": "plain_text", "text": "Close"},
-                    "blocks": [
-                        json.loads(spoiler.message),
-                        {
-                            "type": "context",
-                            "elements": [
-                                {
-                                    "type": "mrkdwn",
-                                    "text": f"spoilered by <@{spoiler.user}>",
-                                }
-                            ],
-                        },
-                    ],
-                }
-                await client.views_open(trigger_id=body["trigger_id"], view=modal)
-                return
-            else:
-                await client.chat_postEphemeral(
-                    channel=channel,
-                    user=user_id,
-                    text="oops, something went wrong fetching that message from the database!",
-                )
-                await send_heartbeat(
-                    heartbeat="Error in view_spoiler_handler",
-                    messages=[f"Spoiler not found in DB for {channel} at {ts}"],
-                )
-                return
+            await send_heartbeat(
+                heartbeat="Error in view_spoiler_handler",
+                messages=[f"Spoiler not found in DB for {channel} at {ts}"],
+            )
+            return
@@ -16,8 +16,11 @@ from slack_extra.commands.love import love_handler
 from slack_extra.commands.manager import manager_handler
 from slack_extra.commands.move import move_handler
 from slack_extra.commands.spoiler import spoiler_handler
+from slack_extra.commands.spoiler_stats import spoiler_stats_handler
 from slack_extra.config import config
+from slack_extra.utils.deadline import expired
 from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.middleware import track_listener
 # from slack_extra.commands.manager import manager_handler
 
 COMMANDS = [
@@ -48,7 +51,7 @@ COMMANDS = [
             {
                 "name": "action",
                 "type": "choice",
-                "choices": ["get", "add", "remove"],
+                "choices": ["get", "add", "remove", "bulk"],
                 "description": "Action to perform",
                 "required": True,
             },
@@ -73,6 +76,20 @@ COMMANDS = [
             }
         ],
     },
+    {
+        "name": "spoilers",
+        "description": "See which spoilers get revealed the most",
+        "function": spoiler_stats_handler,
+        "admin": True,
+        "parameters": [
+            {
+                "name": "channel",
+                "type": "channel",
+                "description": "Only show spoilers from this channel",
+                "required": False,
+            }
+        ],
+    },
     {
         "name": "anchor",
         "description": "Anchor a message in the current channel",
@@ -392,6 +409,12 @@ async def _find_channel_id_by_name(client: AsyncWebClient, name: str) -> str | N
                 cursor = None
             if not cursor:
                 break
+            # Walking every channel in a big workspace takes far longer than the reply can wait
+            if expired():
+                logging.debug(
+                    f"Gave up looking up channel name '{name}' at the deadline"
+                )
+                break
     except SlackApiError as e:
         logging.debug(
             f"Slack API error looking up channel name '{name}': {getattr(e, 'response', str(e))}"
@@ -789,7 +812,8 @@ def register_commands(app: AsyncApp):
             if "location" in sig.parameters:
                 handler_kwargs["location"] = command.get("channel_id")
 
-            await handler(**handler_kwargs)
+            with track_listener("command", cmd["name"]):
+                await handler(**handler_kwargs)
             return
 
         is_admin = user_id == "U054VC2KM9P"
@@ -5,6 +5,9 @@ from slack_bolt.async_app import AsyncRespond
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_extra.utils.client import slack_error
+from slack_extra.utils.usergroups import usergroup_updater
+
 
 async def group_handler(
     ack: AsyncAck,
@@ -17,39 +20,25 @@ async def group_handler(
 ):
     await ack()
     ran = f"\n_You ran `{raw_command}`_"
+    # Writes go through the shared updater so joins and leaves landing together don't
+    # overwrite each other
     try:
-        users = await client.usergroups_users_list(usergroup=group)
+        changed = await usergroup_updater.submit(group, action, performer)
     except SlackApiError as e:
-        await respond(f"Error fetching group members: {e.response['error']}{ran}")
+        doing = "adding you to" if action == "join" else "removing you from"
+        await respond(f"Error {doing} the group: {slack_error(e)}{ran}")
         return
-    users = users.get("users", [])
 
     match action:
         case "join":
-            if performer in users:
+            if not changed:
                 await respond(f"you're already in <!subteam^{group}>!.{ran}")
                 return
-            users.append(performer)
-            try:
-                await client.usergroups_users_update(usergroup=group, users=users)
-            except SlackApiError as e:
-                await respond(
-                    f"Error adding you to the group: {e.response['error']}{ran}"
-                )
-                return
             await respond(f"i just added you to <!subteam^{group}>!")
         case "leave":
-            if performer not in users:
+            if not changed:
                 await respond(
                     f"how do you expect to leave a group you're not in? :p{ran}"
                 )
                 return
-            users.remove(performer)
-            try:
-                await client.usergroups_users_update(usergroup=group, users=users)
-            except SlackApiError as e:
-                await respond(
-                    f"Error removing you from the group: {e.response['error']}{ran}"
-                )
-                return
             await respond(f"just removed you from <!subteam^{group}> :)")
@@ -1,7 +1,14 @@
+from aiohttp import ClientTimeout
 from slack_bolt.async_app import AsyncAck
 from slack_bolt.async_app import AsyncRespond
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_extra.utils.channels import get_channel_info
+from slack_extra.utils.deadline import budget
+from slack_extra.utils.deadline import expired
+from slack_extra.utils.deadline import within_deadline
+from slack_extra.utils.members import count_members
+from slack_extra.utils.members import is_member
 from slack_extra.utils.slack import get_channel_managers
 
 
@@ -42,12 +49,23 @@ async def info_handler(
                 res += f"- :slack: *Slack Email:* {email_addr}\n"
                 res += f"- :slack: *Slack Username:* {username}\n"
                 res += f"- :slack: *Slack ID:* {user}\n"
+                in_channel = None
+                try:
+                    async with within_deadline():
+                        in_channel = await is_member(user, channel)
+                except TimeoutError:
+                    pass
+                if in_channel is not None:
+                    res += f"- :busts_in_silhouette: *In <#{channel}>:* {'Yes' if in_channel else 'No'}\n"
 
                 # Fetch Hackatime trust
                 joe = JOE_ENDPOINT + user
                 try:
+                    if expired():
+                        raise TimeoutError
                     async with env.http.get(
-                        HACKATIME_ENDPOINT.replace("slackid", user)
+                        HACKATIME_ENDPOINT.replace("slackid", user),
+                        timeout=ClientTimeout(total=budget(5)),
                     ) as ht_resp:
                         if ht_resp.status == 200:
                             ht_data = await ht_resp.json()
@@ -80,21 +98,31 @@ async def info_handler(
                 res += "- Could not fetch user info from Slack API.\n"
 
         if email and user:
-            async with env.http.get(
-                IDENTITY_ENDPOINT, params={"slack_id": user}
-            ) as id_resp:
-                if id_resp.status == 200:
-                    id_data = await id_resp.json()
-                    res += f"- :bust_in_silhouette: *IDV:* {id_data.get('result').replace('_', ' ').capitalize()}\n"
-                else:
+            idv = "N/A"
+            try:
+                if expired():
+                    raise TimeoutError
+                async with env.http.get(
+                    IDENTITY_ENDPOINT,
+                    params={"slack_id": user},
+                    timeout=ClientTimeout(total=budget(5)),
+                ) as id_resp:
+                    if id_resp.status == 200:
+                        id_data = await id_resp.json()
+                        idv = id_data.get("result").replace("_", " ").capitalize()
+                # The lookup by email is a fallback; skip it once the reply is due
+                if idv == "N/A" and not expired():
                     async with env.http.get(
-                        IDENTITY_ENDPOINT, params={"email": email}
+                        IDENTITY_ENDPOINT,
+                        params={"email": email},
+                        timeout=ClientTimeout(total=budget(5)),
                     ) as id_resp:
                         if id_resp.status == 200:
                             id_data = await id_resp.json()
-                            res += f"- :bust_in_silhouette: *IDV:* {id_data.get('result').replace('_', ' ').capitalize()}\n"
-                        else:
-                            res += "- :bust_in_silhouette: *IDV:- N/A\n"
+                            idv = id_data.get("result").replace("_", " ").capitalize()
+            except TimeoutError:
+                pass
+            res += f"- :bust_in_silhouette: *IDV:* {idv}\n"
 
         # if email:
         #     api = Api(api_key=config.airtable.nda.api_key)
@@ -118,21 +146,28 @@ async def info_handler(
 
     elif channel:
         res = f"*Channel Info for <#{channel}>:*\n"
-        channel_info = await client.conversations_info(
-            channel=channel, include_num_members=True
-        )
-        if channel_info.get("ok"):
-            channel_data = channel_info.get("channel", {})
+        # Member counts change too often to cache, so count the mirror when we have one
+        member_count = await count_members(channel)
+        if member_count is None:
+            channel_info = await client.conversations_info(
+                channel=channel, include_num_members=True
+            )
+            channel_data = (
+                channel_info.get("channel") if channel_info.get("ok") else None
+            )
+            member_count = (channel_data or {}).get("num_members", 0)
+        else:
+            channel_data = await get_channel_info(channel)
+        if channel_data:
             creator = channel_data.get("creator", "N/A")
             created_ts = channel_data.get("created", 0)
-            member_count = channel_data.get("num_members", 0)
             res += f"- :bust_in_silhouette: *Creator:* <@{creator}>\n"
             from datetime import datetime
 
             created_dt = datetime.fromtimestamp(created_ts)
             res += f"- :calendar: *Created On:* {created_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
             res += f"- :busts_in_silhouette: *Member Count:* {member_count}\n"
-            channel_managers = await get_channel_managers(channel)
+            channel_managers = [] if expired() else await get_channel_managers(channel)
             if channel_managers:
                 manager_mentions = ", ".join([f"<@{mgr}>" for mgr in channel_managers])
                 res += f"- :shield: *Channel Managers:* {manager_mentions}\n"
@@ -2,12 +2,17 @@ from typing import Literal
 
 from slack_bolt.async_app import AsyncAck
 from slack_bolt.async_app import AsyncRespond
+from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_extra.utils.channels import get_channel_info
+from slack_extra.utils.client import slack_error
+from slack_extra.utils.members import is_member
 from slack_extra.utils.slack import add_channel_manager
 from slack_extra.utils.slack import get_channel_managers
 from slack_extra.utils.slack import is_channel_manager
 from slack_extra.utils.slack import remove_channel_manager
+from slack_extra.views.bulk_manager import bulk_manager_view
 
 
 async def manager_handler(
@@ -17,12 +22,22 @@ async def manager_handler(
     performer: str,
     location: str,
     raw_command: str,
-    action: Literal["get", "add", "remove"],
+    command: dict,
+    action: Literal["get", "add", "remove", "bulk"],
     user: str | None = None,
 ):
     await ack()
     ran = f"\n_You ran `{raw_command}`_"
 
+    if action == "bulk":
+        try:
+            await client.views_open(
+                trigger_id=command["trigger_id"], view=bulk_manager_view()
+            )
+        except SlackApiError as e:
+            await respond(f"Error opening modal: {slack_error(e)}{ran}")
+        return
+
     managers = await get_channel_managers(location)
     match action:
         case "get":
@@ -36,12 +51,17 @@ async def manager_handler(
                     f"There are already managers for this channel - please get one of them to give you channel manager.\nManagers: {manager_mentions}{ran}"
                 )
 
-            channel_info = await client.conversations_info(channel=location)
-            creator = channel_info.get("channel", {}).get("creator")
+            channel_info = await get_channel_info(location)
+            creator = channel_info.get("creator")
 
             if performer != creator and not allowed:
                 return await respond(f"You can't claim that channel!{ran}")
 
+            if await is_member(performer, location) is False:
+                return await respond(
+                    f"You must be in the channel to be set as a channel manager{ran}"
+                )
+
             success, res = await add_channel_manager(performer, location)
 
             if success:
@@ -70,6 +90,10 @@ async def manager_handler(
                     return await respond(
                         f"<@{user}> is already a channel manager!{ran}"
                     )
+                if await is_member(user, location) is False:
+                    return await respond(
+                        f"<@{user}> must be in the channel to be a channel manager!{ran}"
+                    )
                 success, res = await add_channel_manager(user, location)
                 if success:
                     return await respond(f"<@{user}> is now a channel manager!{ran}")
@@ -12,7 +12,10 @@ from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.config import config
+from slack_extra.utils.channels import ensure_joined
+from slack_extra.utils.lanes import use_lane
 from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.members import difference
 from slack_extra.utils.slack import is_channel_manager
 
 
@@ -40,15 +43,12 @@ async def move_handler(
                 f"You need to be a channel manager of both channels to move users{ran}"
             )
 
-        finished = False
-        channel_members = []
-        cursor = None
         await send_heartbeat("Joining both channels")
         try:
             channels = [start, end]
             for c in channels:
                 try:
-                    await client.conversations_join(channel=c)
+                    await ensure_joined(c)
                 except SlackApiError as e:
                     error = e.response.get("error")
                     if error in ["channel_not_found", ""]:
@@ -65,69 +65,59 @@ async def move_handler(
                 f"Something went wrong trying to join the channels\n```{tb_str}```{ran}"
             )
 
-        while not finished:
-            try:
-                data = await client.conversations_members(
-                    channel=start, cursor=cursor, limit=200
-                )
-                if data.get("ok"):
-                    cursor = data.get("response_metadata", {}).get("next_cursor")
-                    channel_members += data.get("members", [])
-                    finished = not cursor
-                else:
-                    if data.get("error") == "ratelimited":
-                        retry_after = int(data.headers.get("Retry-After", 3))
-                        await sleep(retry_after)
-                    else:
-                        await send_heartbeat(
-                            "Error when moving members (fetching members)",
-                            messages=[f"```{data}```"],
-                        )
-            except Exception as e:
-                tb = traceback.format_exception(e)
+        try:
+            # Only members of start who aren't in end yet, answered from the mirror
+            channel_members = sorted(await difference(start, end))
+        except Exception as e:
+            tb = traceback.format_exception(e)
 
-                tb_str = "".join(tb)
-                await send_heartbeat(
-                    "Uh oh! Something went wrong when moving D:",
-                    messages=[f"```{tb_str}```"],
-                )
+            tb_str = "".join(tb)
+            await send_heartbeat(
+                "Error when moving members (fetching members)",
+                messages=[f"```{tb_str}```"],
+            )
+            return await respond(f"Couldn't fetch the members of <#{start}>{ran}")
 
         await send_heartbeat(
-            f"<@{performer}> - {len(channel_members)} members fetched from <#{start}>! Adding to <#{end}>"
+            f"<@{performer}> - {len(channel_members)} members of <#{start}> aren't in <#{end}>! Adding them"
         )
         if exclude:
             ids = re.findall(r"<@([^|]+)\|", exclude)
             await send_heartbeat(f"Excluding users: `{ids}`")
             channel_members = [m for m in channel_members if m not in ids]
+        moved = len(channel_members)
 
-        while len(channel_members) > 0:
-            try:
-                users = channel_members[:100]
-                del channel_members[:100]
-                res = await client.conversations_invite(
-                    users=users, channel=end, force=True, token=config.slack.user_token
-                )
-                if not res.get("ok"):
-                    if res.get("error") == "ratelimited":
-                        retry_after = int(res.headers.get("Retry-After", 3))
-                        await sleep(retry_after)
-                    else:
-                        await send_heartbeat(
-                            "Error when moving members (inviting)",
-                            messages=[f"```{res}```"],
-                        )
-            except Exception as e:
-                tb = traceback.format_exception(e)
+        # Big moves shouldn't hold up other people's commands
+        with use_lane("bulk"):
+            while len(channel_members) > 0:
+                try:
+                    users = channel_members[:100]
+                    del channel_members[:100]
+                    res = await client.conversations_invite(
+                        users=users,
+                        channel=end,
+                        force=True,
+                        token=config.slack.user_token,
+                    )
+                    if not res.get("ok"):
+                        if res.get("error") == "ratelimited":
+                            retry_after = int(res.headers.get("Retry-After", 3))
+                            await sleep(retry_after)
+                        else:
+                            await send_heartbeat(
+                                "Error when moving members (inviting)",
+                                messages=[f"```{res}```"],
+                            )
+                except Exception as e:
+                    tb = traceback.format_exception(e)
 
-                tb_str = "".join(tb)
-                await send_heartbeat(
-                    "Uh oh! Something went wrong when moving D:",
-                    messages=[f"```{tb_str}```"],
-                )
+                    tb_str = "".join(tb)
+                    await send_heartbeat(
+                        "Uh oh! Something went wrong when moving D:",
+                        messages=[f"```{tb_str}```"],
+                    )
 
-        await respond(
-            f"Moved {len(channel_members)} members from <#{start}> to <#{end}>"
-        )
+        await respond(f"Moved {moved} members from <#{start}> to <#{end}>")
         return
 
     view = (
@@ -13,7 +13,14 @@ from slack_bolt.async_app import AsyncRespond
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_extra.config import config
+from slack_extra.tables import Spoiler
+from slack_extra.utils.channels import get_channel_info
+from slack_extra.utils.channels import is_joined
+from slack_extra.utils.channels import mark_joined
 from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.modals import open_loading_modal
+from slack_extra.utils.spoilers import cache_spoiler_modal
 
 
 async def spoiler_handler(
@@ -33,107 +40,140 @@ async def spoiler_handler(
     text = spoiler
     bold = True
 
-    try:
-        channel_info = await client.conversations_info(channel=channel)
-    except SlackApiError as e:
-        if e.response["error"] == "channel_not_found":
-            await respond(
-                f"i couldn't find that channel :(\ntry making sure i'm in the channel?{ran}"
-            )
-            return
-        elif e.response["error"] == "not_in_channel":
-            channel_info = await client.conversations_join(channel=channel)
+    # Without text we end on the compose modal; open it before the channel checks can
+    # outlast the trigger_id
+    loading = None
+    if not text:
+        loading = await open_loading_modal(
+            client, command["trigger_id"], "Send Spoiler 👀"
+        )
+
+    async def reply(message: str):
+        if loading:
+            await loading.message(message, title="Send Spoiler 👀")
         else:
-            await respond(f"oops, something went wrong fetching that channel!{ran}")
-            await send_heartbeat(
-                heartbeat="Error in spoiler_handler",
-                messages=[f"Error details: {e.response['error']}"],
-            )
-            return
+            await respond(message)
 
-    in_channel = channel_info.get("channel", {}).get("is_channel", False)
-    if not in_channel:
-        await respond(f"I need access to the channel! Please add me :3{ran}")
-        return
+    try:
+        if not is_joined(channel):
+            try:
+                channel_info = await get_channel_info(channel)
+            except SlackApiError as e:
+                if e.response["error"] == "channel_not_found":
+                    await reply(
+                        f"i couldn't find that channel :(\ntry making sure i'm in the channel?{ran}"
+                    )
+                    return
+                elif e.response["error"] == "not_in_channel":
+                    joined = await client.conversations_join(channel=channel)
+                    channel_info = joined.get("channel", {})
+                else:
+                    await reply(
+                        f"oops, something went wrong fetching that channel!{ran}"
+                    )
+                    await send_heartbeat(
+                        heartbeat="Error in spoiler_handler",
+                        messages=[f"Error details: {e.response['error']}"],
+                    )
+                    return
 
-    if text:
-        spoiler_regex = r"\|\|(.*?)\|\|"
-        spoilers = re.findall(spoiler_regex, text)
-        new_text = text
-        if spoilers:
-            for phrase in spoilers:
-                new_text = new_text.replace(f"||{phrase}||", "`[spoiler hidden]`")
-        else:
-            new_text = "`[spoiler hidden]`"
-            spoilers = [text]
-            bold = False
+            in_channel = channel_info.get("is_channel", False)
+            if not in_channel:
+                await reply(f"I need access to the channel! Please add me :3{ran}")
+                return
+            if channel_info.get("is_member"):
+                await mark_joined(channel)
+
+        if text:
+            spoiler_regex = r"\|\|(.*?)\|\|"
+            spoilers = re.findall(spoiler_regex, text)
+            new_text = text
+            if spoilers:
+                for phrase in spoilers:
+                    new_text = new_text.replace(f"||{phrase}||", "`[spoiler hidden]`")
+            else:
+                new_text = "`[spoiler hidden]`"
+                spoilers = [text]
+                bold = False
 
-        message = (
-            Message().add_block(
-                Section(text=new_text)
-                .accessory(
-                    Button()
-                    .text(f"View {'spoiler' if len(spoilers) == 1 else 'spoilers'}")
-                    .action_id("view_spoiler")
-                    .value("metadata")
+            message = (
+                Message().add_block(
+                    Section(text=new_text)
+                    .accessory(
+                        Button()
+                        .text(f"View {'spoiler' if len(spoilers) == 1 else 'spoilers'}")
+                        .action_id("view_spoiler")
+                        .value("metadata")
+                    )
+                    .text(new_text)
                 )
-                .text(new_text)
-            )
-        ).build()
+            ).build()
 
-        parsed_text = text.replace("||", "")
-        if "*" not in parsed_text and bold:
-            for phrase in spoilers:
-                parsed_text = parsed_text.replace(phrase, f"*{phrase}*")
-        message["metadata"] = {
-            "event_type": "spoiler",
-            "event_payload": {"text": parsed_text, "poster": performer},
-        }
+            parsed_text = text.replace("||", "")
+            if "*" not in parsed_text and bold:
+                for phrase in spoilers:
+                    parsed_text = parsed_text.replace(phrase, f"*{phrase}*")
+            message["metadata"] = {
+                "event_type": "spoiler",
+                "event_payload": {"text": parsed_text, "poster": performer},
+            }
 
-        slack_user = await client.users_info(user=performer)
-        display_name = (
-            slack_user.get("user", {}).get("profile", {}).get("display_name")
-            or slack_user.get("user", {}).get("real_name")
-            or "Unknown User"
-        )
-        pfp = slack_user.get("user", {}).get("profile", {}).get("image_512") or None
-        await client.chat_postMessage(
-            channel=channel, username=display_name, icon_url=pfp, **message
-        )
-    else:
-        modal = (
-            Modal()
-            .callback_id("create_spoiler")
-            .title("Send Spoiler 👀")
-            .add_block(
-                Section(
-                    text="Please wrap the phrases you want spoilered in `||` (double vertical bars). For example, `This is a ||spoiler||.`"
-                )
+            slack_user = await client.users_info(user=performer)
+            display_name = (
+                slack_user.get("user", {}).get("profile", {}).get("display_name")
+                or slack_user.get("user", {}).get("real_name")
+                or "Unknown User"
             )
-            .add_block(
-                Input()
-                .label("Text")
-                .element(
-                    RichTextInput()
-                    .action_id("spoiler_input")
-                    .placeholder("did you know? orpheus loves ||heidi||!")
-                )
-                .block_id("spoiler_input")
+            pfp = slack_user.get("user", {}).get("profile", {}).get("image_512") or None
+            msg = await client.chat_postMessage(
+                channel=channel, username=display_name, icon_url=pfp, **message
             )
-            .add_block(
-                Input()
-                .label("Files!")
-                .element(FileInput().action_id("spoiler_files"))
-                .optional(True)
-                .block_id("spoiler_files")
+            # Stored so reveals don't have to read the message metadata back from Slack
+            block = Section(text=parsed_text).build()
+            await Spoiler.insert(
+                Spoiler(
+                    channel=channel, message_ts=msg["ts"], message=block, user=performer
+                )
             )
-            .private_metadata(channel)
-            .submit("Send Spoiler")
-            .close("Cancel")
-        ).build()
+            cache_spoiler_modal(channel, msg["ts"], block, performer)
+        else:
+            modal = (
+                Modal()
+                .callback_id("create_spoiler")
+                .title("Send Spoiler 👀")
+                .add_block(
+                    Section(
+                        text="Please wrap the phrases you want spoilered in `||` (double vertical bars). For example, `This is a ||spoiler||.`"
+                    )
+                )
+                .add_block(
+                    Input()
+                    .label("Text")
+                    .element(
+                        RichTextInput()
+                        .action_id("spoiler_input")
+                        .placeholder("did you know? orpheus loves ||heidi||!")
+                    )
+                    .block_id("spoiler_input")
+                )
+                .add_block(
+                    Input()
+                    .label("Files!")
+                    .element(FileInput().action_id("spoiler_files"))
+                    .optional(True)
+                    .block_id("spoiler_files")
+                )
+                .private_metadata(channel)
+                .submit("Send Spoiler")
+                .close("Cancel")
+            ).build()
 
-        trigger_id = command.get("trigger_id")
-        await client.views_open(
-            trigger_id=trigger_id,
-            view=modal,
-        )
+            await loading.update(modal)
+    except Exception:
+        # Don't leave the user on the placeholder; the error still reaches Bolt's logs
+        if loading:
+            await loading.message(
+                f"oops, something went wrong! please ask <@{config.slack.maintainer_id}> about it.",
+                title="Send Spoiler 👀",
+            )
+        raise
@@ -0,0 +1,56 @@
+import asyncio
+
+from slack_bolt.async_app import AsyncAck
+from slack_bolt.async_app import AsyncRespond
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_extra.tables import SpoilerClick
+from slack_extra.utils.spoilers import spoiler_clicks
+
+
+async def spoiler_stats_handler(
+    ack: AsyncAck,
+    client: AsyncWebClient,
+    respond: AsyncRespond,
+    performer: str,
+    location: str,
+    channel: str | None = None,
+):
+    await ack()
+    # Include clicks that haven't been written yet
+    await spoiler_clicks.flush()
+
+    where = "WHERE channel = {}" if channel else ""
+    rows = await SpoilerClick.raw(
+        f"""
+        SELECT channel, message_ts, SUM(clicks) AS clicks, COUNT(*) AS viewers
+        FROM spoiler_click {where}
+        GROUP BY channel, message_ts
+        ORDER BY clicks DESC
+        LIMIT 10
+        """,
+        *([channel] if channel else []),
+    )
+    scope = f" in <#{channel}>" if channel else ""
+    if not rows:
+        await respond(f"no spoilers have been revealed{scope} yet :eyes:")
+        return
+
+    links = await asyncio.gather(
+        *[
+            client.chat_getPermalink(
+                channel=row["channel"], message_ts=row["message_ts"]
+            )
+            for row in rows
+        ],
+        return_exceptions=True,
+    )
+    res = f"*Most revealed spoilers{scope}:*\n"
+    for row, link in zip(rows, links):
+        spoiler = (
+            f"<{link['permalink']}|spoiler>"
+            if not isinstance(link, Exception)
+            else f"spoiler `{row['message_ts']}`"
+        )
+        res += f"- {spoiler} in <#{row['channel']}>: {row['clicks']} clicks by {row['viewers']} people\n"
+    await respond(res)
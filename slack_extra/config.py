@@ -1,3 +1,6 @@
+from typing import Literal
+
+from pydantic import model_validator
 from pydantic import PostgresDsn
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
@@ -28,6 +31,138 @@ class AirtableConfig(BaseSettings):
     nda: AirtableNDABaseConfig
 
 
+class WorkersConfig(BaseSettings):
+    # "thread" or "process" pool for CPU-bound work
+    kind: Literal["thread", "process"] = "thread"
+    max_workers: int | None = None
+    # Inputs smaller than this (in bytes of JSON) are processed inline on the event loop
+    offload_threshold: int = 16_384
+
+
+class FileRelayConfig(BaseSettings):
+    # Total bytes of files being relayed at once across the whole process
+    max_in_flight_bytes: int = 256 * 1024 * 1024
+    # Files are kept in memory up to this size, then spooled to a temp file
+    spool_memory_bytes: int = 1024 * 1024
+    chunk_size: int = 64 * 1024
+
+
+class SpoilersConfig(BaseSettings):
+    # Number of reveal modals kept in memory for popular spoilers
+    modal_cache_size: int = 1024
+    # Spoilers older than this are moved to the archive table; unset keeps them forever
+    retention_days: int | None = None
+    # Seconds between archive runs, and rows moved per transaction
+    archive_interval: int = 60 * 60
+    archive_batch_size: int = 1000
+    # Seconds between writes of buffered reveal clicks, and the most (spoiler, user) pairs
+    # buffered; clicks past that are dropped while writes fail
+    click_flush_interval: int = 30
+    click_buffer_size: int = 50_000
+
+
+class EventsConfig(BaseSettings):
+    # Recently handled event ids kept in memory to drop Slack's retries
+    dedup_cache_size: int = 10_000
+    # Also claim event ids in Postgres, for running more than one replica
+    dedup_shared: bool = False
+    # Seconds to keep shared event ids; Slack stops retrying after about an hour
+    dedup_retention: int = 2 * 60 * 60
+    # Acknowledged events waiting for one of `queue_workers` workers; listeners wait for
+    # room once `queue_size` are queued
+    queue_size: int = 1000
+    queue_workers: int = 16
+    # Seconds to spend finishing queued events on shutdown
+    drain_timeout: float = 20
+
+
+class MoversConfig(BaseSettings):
+    # Seconds during which joins to a mover group's channels are treated as caused by our
+    # own invites after a user has been propagated
+    ledger_ttl: int = 5 * 60
+    # Background reconciler that invites members who joined a group's channel while we
+    # weren't listening. Seconds between runs, 0 (the default) to disable. Opting in
+    # force-invites everyone in any of a group's channels to all of them, including
+    # members from before the mover was set up and anyone who left one on purpose.
+    reconcile_interval: int = 0
+    # Slack calls per second the reconciler may make
+    reconcile_rate: float = 0.5
+    # Users per conversations.invite call (Slack allows up to 1000)
+    reconcile_batch_size: int = 1000
+
+
+class MembersConfig(BaseSettings):
+    # Seconds between full crawls of the bot's channels; join/leave events keep the mirror
+    # current in between
+    resync_interval: int = 24 * 60 * 60
+    # Slack calls per second the background crawler may make, and crawls a command needs
+    # straight away, e.g. /se move for a channel that isn't mirrored yet
+    sync_rate: float = 0.5
+    demand_rate: float = 1.0
+
+
+class ChannelsConfig(BaseSettings):
+    # Seconds to keep conversations.info results; renames, archives and conversions to
+    # private drop them sooner
+    info_ttl: int = 60 * 60
+    info_cache_size: int = 5000
+
+
+class ManagersConfig(BaseSettings):
+    # Bulk `/se manager bulk` assignments: admin.roles calls per second, how many may be in
+    # flight at once, and users per call
+    bulk_rate: float = 0.3
+    bulk_concurrency: int = 4
+    bulk_batch_size: int = 10
+
+
+class UsergroupsConfig(BaseSettings):
+    # Seconds to collect /se group joins and leaves before writing them in one update
+    batch_window: float = 1.0
+    # Seconds to trust a group's member list between batches
+    members_ttl: int = 30
+
+
+class ApiConfig(BaseSettings):
+    # Slack calls in flight at once across the app, and how many of those only slash
+    # commands, actions and modals may use, so bulk work and events can't starve them
+    max_concurrency: int = 32
+    interactive_reserved: int = 8
+    # Seconds a call can wait before it's served ahead of busier, more important lanes
+    max_wait: float = 2.0
+
+    @model_validator(mode="after")
+    def check_reserved(self):
+        # Otherwise events, jobs and heartbeats would never get a slot
+        if not 0 <= self.interactive_reserved < self.max_concurrency:
+            raise ValueError(
+                "interactive_reserved must be at least 0 and less than max_concurrency"
+            )
+        return self
+
+
+class MonitorConfig(BaseSettings):
+    # Seconds between event loop lag samples
+    lag_interval: float = 0.5
+    # Lag (in seconds) past which a stall is counted and the loop thread's stack is logged
+    lag_threshold: float = 0.25
+    # Seconds between counts of pending asyncio tasks
+    census_interval: int = 30
+
+
+class HealthConfig(BaseSettings):
+    # Seconds between background dependency checks; probes only read the cached result
+    probe_interval: int = 10
+    # Seconds before a single dependency check counts as failed
+    timeout: float = 5
+
+
+class DebugConfig(BaseSettings):
+    # Bearer token for the /debug routes; they're disabled when unset
+    admin_token: str | None = None
+    profile_max_seconds: int = 60
+
+
 class Config(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env", env_nested_delimiter="__", extra="ignore"
@@ -35,6 +170,20 @@ class Config(BaseSettings):
     slack: SlackConfig
     airtable: AirtableConfig
     database_url: PostgresDsn
+    database_pool_size: int = 10
+    workers: WorkersConfig = WorkersConfig()
+    file_relay: FileRelayConfig = FileRelayConfig()
+    spoilers: SpoilersConfig = SpoilersConfig()
+    events: EventsConfig = EventsConfig()
+    movers: MoversConfig = MoversConfig()
+    members: MembersConfig = MembersConfig()
+    channels: ChannelsConfig = ChannelsConfig()
+    usergroups: UsergroupsConfig = UsergroupsConfig()
+    managers: ManagersConfig = ManagersConfig()
+    api: ApiConfig = ApiConfig()
+    monitor: MonitorConfig = MonitorConfig()
+    health: HealthConfig = HealthConfig()
+    debug: DebugConfig = DebugConfig()
     environment: str = "development"
     port: int = 3000
 
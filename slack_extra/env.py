@@ -3,6 +3,7 @@ import logging
 from time import time
 
 from aiohttp import ClientSession
+from piccolo.engine import engine_finder
 from slack_bolt.async_app import AsyncApp
 from slack_sdk.web.async_client import AsyncWebClient
 from starlette.applications import Starlette
@@ -11,8 +12,18 @@ from slack_extra.actions import register_actions
 from slack_extra.commands import register_commands
 from slack_extra.config import config
 from slack_extra.events import register_events
+from slack_extra.jobs import start_jobs
+from slack_extra.jobs import stop_jobs
 from slack_extra.shortcuts import register_shortcuts
+from slack_extra.utils.anchors import load_anchored_channels
+from slack_extra.utils.channels import load_joined_channels
+from slack_extra.utils.client import InstrumentedWebClient
+from slack_extra.utils.event_queue import event_queue
+from slack_extra.utils.executor import shutdown_executor
+from slack_extra.utils.logging import flush_heartbeats
 from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.middleware import register_middleware
+from slack_extra.utils.monitor import loop_monitor
 from slack_extra.views import register_views
 
 logger = logging.getLogger(__name__)
@@ -20,9 +31,11 @@ logger = logging.getLogger(__name__)
 
 class Environment:
     slack_client: AsyncWebClient
+    bot_user_id: str
     http: ClientSession
     app = AsyncApp(
-        token=config.slack.bot_token, signing_secret=config.slack.signing_secret
+        client=InstrumentedWebClient(token=config.slack.bot_token),
+        signing_secret=config.slack.signing_secret,
     )
 
     @contextlib.asynccontextmanager
@@ -30,13 +43,21 @@ class Environment:
         st = time()
         logger.debug("Entering environment context")
         self.http = ClientSession()
-        self.slack_client = AsyncWebClient(token=config.slack.bot_token)
-
+        await engine_finder().start_connection_pool(max_size=config.database_pool_size)
+        self.slack_client = InstrumentedWebClient(token=config.slack.bot_token)
+        self.bot_user_id = (await self.slack_client.auth_test())["user_id"]
+        await load_joined_channels()
+        await load_anchored_channels()
+
+        loop_monitor.start()
+        event_queue.start()
+        register_middleware(env.app)
         register_commands(env.app)
         register_shortcuts(env.app)
         register_actions(env.app)
         register_views(env.app)
         register_events(env.app)
+        start_jobs()
 
         handler = None
         if config.slack.app_token:
@@ -66,7 +87,14 @@ class Environment:
             logger.debug("Stopping Socket Mode handler")
             await handler.close_async()
 
+        # No new events arrive past this point; finish the ones already acknowledged
+        await event_queue.drain()
+        await stop_jobs()
+        await flush_heartbeats()
+        await loop_monitor.stop()
+        shutdown_executor()
         await self.http.close()
+        await engine_finder().close_connection_pool()
 
 
 env = Environment()
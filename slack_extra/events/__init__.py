@@ -1,15 +1,31 @@
 from slack_extra.events.channel_created import channel_created_handler
+from slack_extra.events.channel_left import channel_left_handler
+from slack_extra.events.channel_updated import channel_updated_handler
 from slack_extra.events.member_joined_channel import member_joined_channel_handler
+from slack_extra.events.member_left_channel import member_left_channel_handler
 from slack_extra.events.message import message_handler
+from slack_extra.utils.middleware import instrument
 
 
 EVENTS = [
     {"id": "message", "handler": message_handler},
     {"id": "channel_created", "handler": channel_created_handler},
+    {"id": "channel_left", "handler": channel_left_handler},
+    # Same event for private channels
+    {"id": "group_left", "handler": channel_left_handler},
+    # Events that make cached channel metadata stale
+    {"id": "channel_rename", "handler": channel_updated_handler},
+    {"id": "channel_archive", "handler": channel_updated_handler},
+    {"id": "channel_unarchive", "handler": channel_updated_handler},
+    {"id": "channel_deleted", "handler": channel_updated_handler},
+    {"id": "group_rename", "handler": channel_updated_handler},
+    {"id": "group_archive", "handler": channel_updated_handler},
+    {"id": "group_unarchive", "handler": channel_updated_handler},
     {"id": "member_joined_channel", "handler": member_joined_channel_handler},
+    {"id": "member_left_channel", "handler": member_left_channel_handler},
 ]
 
 
 def register_events(app):
     for event in EVENTS:
-        app.event(event["id"])(event["handler"])
+        app.event(event["id"])(instrument("event", event["id"])(event["handler"]))
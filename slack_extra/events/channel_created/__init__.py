@@ -2,6 +2,7 @@ from slack_bolt.context.ack.async_ack import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.events.channel_created.join_channel import join_channel_handler
+from slack_extra.utils.event_queue import event_queue
 
 
 async def channel_created_handler(
@@ -9,4 +10,4 @@ async def channel_created_handler(
 ):
     await ack()
 
-    await join_channel_handler(body, event, client)
+    await event_queue.put("channel_created", join_channel_handler, body, event, client)
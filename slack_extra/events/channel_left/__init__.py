@@ -0,0 +1,9 @@
+from slack_bolt.context.ack.async_ack import AsyncAck
+
+from slack_extra.events.channel_left.members import track_bot_leave_handler
+
+
+async def channel_left_handler(ack: AsyncAck, body: dict, event: dict):
+    await ack()
+
+    await track_bot_leave_handler(body, event)
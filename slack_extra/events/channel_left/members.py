@@ -0,0 +1,5 @@
+from slack_extra.utils.channels import mark_left
+
+
+async def track_bot_leave_handler(body: dict, event: dict):
+    await mark_left(event["channel"])
@@ -0,0 +1,11 @@
+from slack_bolt.context.ack.async_ack import AsyncAck
+
+from slack_extra.events.channel_updated.channel_info import (
+    invalidate_channel_info_handler,
+)
+
+
+async def channel_updated_handler(ack: AsyncAck, body: dict, event: dict):
+    await ack()
+
+    await invalidate_channel_info_handler(body, event)
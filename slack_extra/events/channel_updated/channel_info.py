@@ -0,0 +1,9 @@
+from slack_extra.utils.channels import invalidate_channel_info
+
+
+async def invalidate_channel_info_handler(body: dict, event: dict):
+    channel = event["channel"]
+    # channel_rename and group_rename send the channel object instead of its id
+    if isinstance(channel, dict):
+        channel = channel["id"]
+    invalidate_channel_info(channel)
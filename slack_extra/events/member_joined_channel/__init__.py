@@ -1,7 +1,9 @@
 from slack_bolt.context.ack.async_ack import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_extra.events.member_joined_channel.members import track_join_handler
 from slack_extra.events.member_joined_channel.move import mover_handler
+from slack_extra.utils.event_queue import event_queue
 
 
 async def member_joined_channel_handler(
@@ -9,4 +11,6 @@ async def member_joined_channel_handler(
 ):
     await ack()
 
-    await mover_handler(body, event, client)
+    # Mirror the join in order with leaves; the invites can wait for a worker
+    await track_join_handler(body, event)
+    await event_queue.put("member_joined_channel", mover_handler, body, event, client)
@@ -0,0 +1,11 @@
+from slack_extra.utils.channels import mark_joined
+from slack_extra.utils.members import add_member
+
+
+async def track_join_handler(body: dict, event: dict):
+    from slack_extra.env import env
+
+    if event["user"] == env.bot_user_id:
+        await mark_joined(event["channel"])
+    else:
+        await add_member(event["channel"], event["user"])
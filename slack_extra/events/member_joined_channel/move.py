@@ -3,7 +3,24 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.config import config
 from slack_extra.tables import MigrationChannel
+from slack_extra.utils.cache import TTLCache
+from slack_extra.utils.lanes import use_lane
 from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.members import channels_with_member
+from slack_extra.utils.metrics import Counter
+
+MOVER_JOINS = Counter(
+    "slack_extra_mover_joins_total",
+    "member_joined_channel events in mover groups, by whether they were propagated",
+    ("result",),
+)
+
+# (user, mover group) pairs we've just propagated. Our own invites fire member_joined_channel
+# in every sibling channel; those joins are skipped instead of re-inviting the user to the
+# whole group again, so one join costs N-1 invites rather than about N^2.
+propagation_ledger: TTLCache[tuple[str, int], bool] = TTLCache(
+    maxsize=10_000, ttl=config.movers.ledger_ttl
+)
 
 
 async def mover_handler(body: dict, event: dict, client: AsyncWebClient):
@@ -15,24 +32,39 @@ async def mover_handler(body: dict, event: dict, client: AsyncWebClient):
     )
     if migration_channel:
         migration_channel = migration_channel[0]
+        if (user_id, migration_channel.config) in propagation_ledger:
+            MOVER_JOINS.inc(result="suppressed")
+            return
+        propagation_ledger.set((user_id, migration_channel.config), True)
+        MOVER_JOINS.inc(result="propagated")
+
         channels = await MigrationChannel.objects().where(
             MigrationChannel.config == migration_channel.config
         )
         channels = [chan.channel_id for chan in channels]
-        for chan in channels:
-            if chan != channel_id:
-                try:
-                    await client.conversations_invite(
-                        channel=chan, users=[user_id], token=config.slack.user_token
-                    )
-                except SlackApiError as e:
-                    if e.response["error"] == "already_in_channel":
-                        pass
-                    else:
-                        await send_heartbeat(
-                            f"Error inviting user {user_id} to channel {chan}: {e}"
+        # Mirrored channels the user is already in don't need an invite
+        already_in = await channels_with_member(user_id, channels)
+        # Fanning one join out to the whole group is background work
+        with use_lane("bulk"):
+            for chan in channels:
+                if chan != channel_id and chan not in already_in:
+                    try:
+                        await client.conversations_invite(
+                            channel=chan, users=[user_id], token=config.slack.user_token
                         )
-        c_str = ", ".join([f"<#{chan}>" for chan in channels if chan != channel_id])
+                    except SlackApiError as e:
+                        if e.response["error"] == "already_in_channel":
+                            pass
+                        else:
+                            await send_heartbeat(
+                                f"Error inviting user {user_id} to channel {chan}: {e}"
+                            )
+        added = [
+            chan for chan in channels if chan != channel_id and chan not in already_in
+        ]
+        if not added:
+            return
+        c_str = ", ".join([f"<#{chan}>" for chan in added])
         await client.chat_postEphemeral(
             channel=channel_id,
             user=user_id,
@@ -0,0 +1,9 @@
+from slack_bolt.context.ack.async_ack import AsyncAck
+
+from slack_extra.events.member_left_channel.members import track_leave_handler
+
+
+async def member_left_channel_handler(ack: AsyncAck, body: dict, event: dict):
+    await ack()
+
+    await track_leave_handler(body, event)
@@ -0,0 +1,5 @@
+from slack_extra.utils.members import remove_member
+
+
+async def track_leave_handler(body: dict, event: dict):
+    await remove_member(event["channel"], event["user"])
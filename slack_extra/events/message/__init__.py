@@ -2,6 +2,8 @@ from slack_bolt.context.ack.async_ack import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.events.message.anchor import anchor_message_handler
+from slack_extra.events.message.channel_info import channel_info_message_handler
+from slack_extra.utils.event_queue import event_queue
 
 
 async def message_handler(
@@ -9,4 +11,5 @@ async def message_handler(
 ):
     await ack()
 
-    await anchor_message_handler(body, event, client)
+    await channel_info_message_handler(body, event)
+    await event_queue.put("message", anchor_message_handler, body, event, client)
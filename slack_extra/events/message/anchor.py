@@ -6,36 +6,40 @@ from slack_sdk.web.async_client import AsyncWebClient
 from slack_extra.config import config
 from slack_extra.datastore import PiccoloInstallationStore
 from slack_extra.tables import AnchorConfig
+from slack_extra.utils.anchors import set_anchored
 from slack_extra.utils.logging import send_heartbeat
 
 
+# Subtypes that count as activity in the channel and bump the anchor back down
+ANCHOR_SUBTYPES = {
+    "bot_message",
+    "file_share",
+    "me_message",
+    "thread_broadcast",
+    None,
+    "channel_convert_to_private",
+    "channel_convert_to_public",
+    "channel_join",
+    "channel_leave",
+    "channel_name",
+    "channel_purpose",
+    "channel_posting_permissions",
+    "channel_topic",
+    "channel_unarchive",
+    "group_join",
+    "group_leave",
+    "group_name",
+    "group_purpose",
+    "group_topic",
+    "group_unarchive",
+}
+
+
 async def anchor_message_handler(body: dict, event: dict, client: AsyncWebClient):
     channel = event["channel"]
     subtype = event.get("subtype")
-    subtypes = [
-        "bot_message",
-        "file_share",
-        "me_message",
-        "thread_broadcast",
-        None,
-        "channel_convert_to_private",
-        "channel_convert_to_public",
-        "channel_join",
-        "channel_leave",
-        "channel_name",
-        "channel_purpose",
-        "channel_posting_permissions",
-        "channel_topic",
-        "channel_unarchive",
-        "group_join",
-        "group_leave",
-        "group_name",
-        "group_purpose",
-        "group_topic",
-        "group_unarchive",
-    ]
-
-    if subtype not in subtypes:
+
+    if subtype not in ANCHOR_SUBTYPES:
         return
 
     anchor_config = (
@@ -104,6 +108,7 @@ async def anchor_message_handler(body: dict, event: dict, client: AsyncWebClient
             await AnchorConfig.update({AnchorConfig.enabled: False}).where(
                 AnchorConfig.channel_id == channel
             )
+            set_anchored(channel, False)
             await client.chat_postMessage(
                 channel=anchor_config.user_id,
                 text=f"hey! i had to disable anchor messages in <#{channel}> because i got this error - `{error}`.\nif you're confused, maybe check out <#{config.slack.support_channel}> for help!",
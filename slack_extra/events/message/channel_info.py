@@ -0,0 +1,18 @@
+from slack_extra.utils.channels import invalidate_channel_info
+
+# Messages Slack posts when a channel's metadata changes. Conversion to private only shows
+# up this way.
+CHANNEL_SUBTYPES = {
+    "channel_convert_to_private",
+    "channel_name",
+    "channel_archive",
+    "channel_unarchive",
+    "group_name",
+    "group_archive",
+    "group_unarchive",
+}
+
+
+async def channel_info_message_handler(body: dict, event: dict):
+    if event.get("subtype") in CHANNEL_SUBTYPES:
+        invalidate_channel_info(event["channel"])
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+
+from slack_extra.config import config
+from slack_extra.jobs.archive_spoilers import archive_spoilers_job
+from slack_extra.jobs.flush_spoiler_clicks import flush_spoiler_clicks_job
+from slack_extra.jobs.health_probe import health_probe_job
+from slack_extra.jobs.load_anchors import load_anchors_job
+from slack_extra.jobs.prune_processed_events import prune_processed_events_job
+from slack_extra.jobs.reconcile_movers import reconcile_movers_job
+from slack_extra.jobs.sync_members import sync_members_job
+from slack_extra.jobs.task_census import task_census_job
+from slack_extra.utils.logging import send_heartbeat
+
+logger = logging.getLogger(__name__)
+
+JOBS = [
+    {
+        "id": "health_probe",
+        "handler": health_probe_job,
+        "interval": config.health.probe_interval,
+    },
+    {
+        "id": "archive_spoilers",
+        "handler": archive_spoilers_job,
+        "interval": config.spoilers.archive_interval,
+        "enabled": config.spoilers.retention_days is not None,
+    },
+    {
+        "id": "flush_spoiler_clicks",
+        "handler": flush_spoiler_clicks_job,
+        "interval": config.spoilers.click_flush_interval,
+        "run_on_shutdown": True,
+    },
+    {
+        "id": "load_anchors",
+        "handler": load_anchors_job,
+        "interval": 60,
+        # With a single replica every anchor change goes through our own handlers
+        "enabled": config.events.dedup_shared,
+    },
+    {
+        "id": "prune_processed_events",
+        "handler": prune_processed_events_job,
+        "interval": 10 * 60,
+        "enabled": config.events.dedup_shared,
+    },
+    {
+        "id": "reconcile_movers",
+        "handler": reconcile_movers_job,
+        "interval": config.movers.reconcile_interval,
+        "enabled": config.movers.reconcile_interval > 0,
+    },
+    {
+        "id": "sync_members",
+        "handler": sync_members_job,
+        # Only channels last crawled more than resync_interval ago are crawled again
+        "interval": 60 * 60,
+    },
+    {
+        "id": "task_census",
+        "handler": task_census_job,
+        "interval": config.monitor.census_interval,
+    },
+]
+
+_tasks: list[asyncio.Task] = []
+
+
+async def _run_job(job: dict):
+    while True:
+        try:
+            await job["handler"]()
+        except Exception as e:
+            logger.exception(f"Job {job['id']} failed")
+            await send_heartbeat(f"job `{job['id']}` failed: `{e}`")
+        await asyncio.sleep(job["interval"])
+
+
+def start_jobs():
+    for job in JOBS:
+        if job.get("enabled", True):
+            _tasks.append(asyncio.create_task(_run_job(job), name=f"job:{job['id']}"))
+
+
+async def stop_jobs():
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+
+    for job in JOBS:
+        if job.get("enabled", True) and job.get("run_on_shutdown"):
+            try:
+                await job["handler"]()
+            except Exception:
+                logger.exception(f"Job {job['id']} failed during shutdown")
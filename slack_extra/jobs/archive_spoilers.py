@@ -0,0 +1,43 @@
+import logging
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from slack_extra.config import config
+from slack_extra.tables import Spoiler
+from slack_extra.tables import SpoilerArchive
+from slack_extra.utils.spoilers import pack_spoiler_message
+
+logger = logging.getLogger(__name__)
+
+
+async def archive_spoilers_job():
+    """Move spoilers older than the retention period into the compressed archive table."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=config.spoilers.retention_days)
+    archived = 0
+    while True:
+        async with Spoiler._meta.db.transaction():
+            rows = (
+                await Spoiler.select()
+                .where(Spoiler.created_at < cutoff)
+                .order_by(Spoiler.id)
+                .limit(config.spoilers.archive_batch_size)
+            )
+            if not rows:
+                break
+            await SpoilerArchive.insert(
+                *[
+                    SpoilerArchive(
+                        channel=row["channel"],
+                        message_ts=row["message_ts"],
+                        message=pack_spoiler_message(row["message"]),
+                        user=row["user"],
+                        created_at=row["created_at"],
+                    )
+                    for row in rows
+                ]
+            ).on_conflict(action="DO NOTHING")
+            await Spoiler.delete().where(Spoiler.id.is_in([row["id"] for row in rows]))
+        archived += len(rows)
+    if archived:
+        logger.info(f"Archived {archived} spoilers older than {cutoff.isoformat()}")
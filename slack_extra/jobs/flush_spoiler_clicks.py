@@ -0,0 +1,11 @@
+import logging
+
+from slack_extra.utils.spoilers import spoiler_clicks
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_spoiler_clicks_job():
+    flushed = await spoiler_clicks.flush()
+    if flushed:
+        logger.debug(f"Flushed reveal clicks for {flushed} spoiler viewers")
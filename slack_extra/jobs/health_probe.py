@@ -0,0 +1,5 @@
+from slack_extra.utils.health import health_checker
+
+
+async def health_probe_job():
+    await health_checker.probe()
@@ -0,0 +1,6 @@
+from slack_extra.utils.anchors import load_anchored_channels
+
+
+async def load_anchors_job():
+    """Pick up anchors enabled or disabled through other replicas."""
+    await load_anchored_channels()
@@ -0,0 +1,14 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from slack_extra.config import config
+from slack_extra.tables import ProcessedEvent
+
+
+async def prune_processed_events_job():
+    """Forget shared event ids once Slack has stopped retrying them."""
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        seconds=config.events.dedup_retention
+    )
+    await ProcessedEvent.delete().where(ProcessedEvent.received_at < cutoff)
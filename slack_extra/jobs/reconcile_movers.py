@@ -0,0 +1,179 @@
+import logging
+import zlib
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from slack_sdk.errors import SlackApiError
+
+from slack_extra.config import config
+from slack_extra.events.member_joined_channel.move import propagation_ledger
+from slack_extra.tables import MigrationChannel
+from slack_extra.tables import MigrationConfig
+from slack_extra.tables import MoverCheckpoint
+from slack_extra.utils.channels import get_channel_info
+from slack_extra.utils.client import slack_error
+from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.metrics import Counter
+from slack_extra.utils.ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_INVITES = Counter(
+    "slack_extra_mover_reconcile_invites_total",
+    "Users invited by the background mover reconciler",
+)
+
+# conversations.members and conversations.invite are both Tier 3 (~50/min); leave room for
+# the live mover and commands
+limiter = RateLimiter(rate=config.movers.reconcile_rate)
+
+
+def _pack_members(members: dict[str, set[str]]) -> bytes:
+    # One line per channel: "C123 U1,U2,..." with sorted ids, which compress well
+    text = "\n".join(
+        f"{channel} {','.join(sorted(ids))}" for channel, ids in members.items()
+    )
+    return zlib.compress(text.encode())
+
+
+def _unpack_members(data: bytes | None) -> dict[str, set[str]]:
+    if not data:
+        return {}
+    members = {}
+    for line in zlib.decompress(data).decode().splitlines():
+        channel, _, ids = line.partition(" ")
+        members[channel] = set(ids.split(",")) if ids else set()
+    return members
+
+
+async def _save(checkpoint: MoverCheckpoint, members: dict[str, set[str]]):
+    checkpoint.members = _pack_members(members)
+    checkpoint.updated_at = datetime.now(timezone.utc)
+    await checkpoint.save()
+
+
+async def reconcile_group(config_id: int):
+    """Invite every member of a mover group to the group's channels they're missing from."""
+    from slack_extra.env import env
+
+    channels = []
+    for row in await MigrationChannel.select(MigrationChannel.channel_id).where(
+        MigrationChannel.config == config_id
+    ):
+        try:
+            info = await get_channel_info(row["channel_id"])
+        except SlackApiError as e:
+            await send_heartbeat(
+                f"Mover reconciler couldn't look up <#{row['channel_id']}>: `{slack_error(e)}`"
+            )
+            continue
+        # Archived channels can't be invited to; skip them instead of failing every batch
+        if not info.get("is_archived"):
+            channels.append(row["channel_id"])
+    channels.sort()
+    if len(channels) < 2:
+        return
+
+    checkpoint = await MoverCheckpoint.objects().get_or_create(
+        MoverCheckpoint.config == config_id
+    )
+    members = {
+        channel: ids
+        for channel, ids in _unpack_members(checkpoint.members).items()
+        if channel in channels
+    }
+
+    failed = set()
+    for channel in channels:
+        # Channels already in the checkpoint were fully paged, except the one we stopped on
+        if channel in members and channel != checkpoint.channel_id:
+            continue
+        if channel != checkpoint.channel_id or channel not in members:
+            checkpoint.channel_id = channel
+            checkpoint.cursor = None
+            members[channel] = set()
+        while True:
+            try:
+                page = await limiter.call(
+                    env.slack_client.conversations_members,
+                    channel=channel,
+                    cursor=checkpoint.cursor,
+                    limit=1000,
+                )
+            except SlackApiError as e:
+                if slack_error(e) == "invalid_cursor":
+                    # The saved cursor expired while we were down; page this channel again
+                    checkpoint.cursor = None
+                    members[channel] = set()
+                    continue
+                await send_heartbeat(
+                    f"Mover reconciler couldn't list members of <#{channel}>: `{slack_error(e)}`"
+                )
+                # Leave the channel out of this run rather than stopping on it every run
+                failed.add(channel)
+                del members[channel]
+                checkpoint.channel_id = None
+                checkpoint.cursor = None
+                break
+            members[channel].update(page.get("members", []))
+            checkpoint.cursor = (page.get("response_metadata") or {}).get(
+                "next_cursor"
+            ) or None
+            if not checkpoint.cursor:
+                checkpoint.channel_id = None
+            await _save(checkpoint, members)
+            if not checkpoint.cursor:
+                break
+
+    channels = [channel for channel in channels if channel not in failed]
+    everyone = set().union(*members.values())
+    for channel in channels:
+        missing = sorted(everyone - members[channel])
+        for start in range(0, len(missing), config.movers.reconcile_batch_size):
+            batch = missing[start : start + config.movers.reconcile_batch_size]
+            # The joins these invites cause shouldn't be propagated again by mover_handler
+            for user in batch:
+                propagation_ledger.set((user, config_id), True)
+            try:
+                await limiter.call(
+                    env.slack_client.conversations_invite,
+                    channel=channel,
+                    users=batch,
+                    force=True,
+                    token=config.slack.user_token,
+                )
+            except SlackApiError as e:
+                if slack_error(e) != "already_in_channel":
+                    await send_heartbeat(
+                        f"Mover reconciler couldn't invite {len(batch)} users to <#{channel}>: `{slack_error(e)}`"
+                    )
+                    continue
+            RECONCILE_INVITES.inc(len(batch))
+            members[channel].update(batch)
+            await _save(checkpoint, members)
+        if missing:
+            logger.info(
+                f"Reconciled {len(missing)} missing members into {channel} (mover group {config_id})"
+            )
+
+    checkpoint.channel_id = None
+    checkpoint.cursor = None
+    checkpoint.completed_at = datetime.now(timezone.utc)
+    await _save(checkpoint, {})
+
+
+async def reconcile_movers_job():
+    recent = datetime.now(timezone.utc) - timedelta(
+        seconds=config.movers.reconcile_interval
+    )
+    done = {
+        row["config"]
+        for row in await MoverCheckpoint.select(MoverCheckpoint.config).where(
+            MoverCheckpoint.completed_at > recent
+        )
+    }
+    for group in await MigrationConfig.select(MigrationConfig.id):
+        # Restarts resume where the last run left off instead of crawling every group again
+        if group["id"] not in done:
+            await reconcile_group(group["id"])
@@ -0,0 +1,69 @@
+import logging
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from slack_sdk.errors import SlackApiError
+
+from slack_extra.config import config
+from slack_extra.tables import ChannelMemberSync
+from slack_extra.utils.channels import replace_joined_channels
+from slack_extra.utils.client import slack_error
+from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.members import forget_channel
+from slack_extra.utils.members import limiter
+from slack_extra.utils.members import sync_channel
+
+logger = logging.getLogger(__name__)
+
+
+async def _bot_channels() -> set[str]:
+    from slack_extra.env import env
+
+    channels = set()
+    cursor = None
+    while True:
+        page = await limiter.call(
+            env.slack_client.users_conversations,
+            types="public_channel,private_channel",
+            exclude_archived=True,
+            cursor=cursor,
+            limit=1000,
+        )
+        channels.update(channel["id"] for channel in page.get("channels", []))
+        cursor = (page.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return channels
+
+
+async def sync_members_job():
+    """Crawl the bot's channels that haven't been mirrored recently."""
+    channels = await _bot_channels()
+    replace_joined_channels(channels)
+    recent = datetime.now(timezone.utc) - timedelta(
+        seconds=config.members.resync_interval
+    )
+    synced = {
+        row["channel_id"]: row["synced_at"]
+        for row in await ChannelMemberSync.select(
+            ChannelMemberSync.channel_id, ChannelMemberSync.synced_at
+        )
+    }
+
+    # Join/leave events only arrive for channels we're in, so anything else goes stale
+    for channel in synced.keys() - channels:
+        await forget_channel(channel)
+
+    stale = [c for c in channels if c not in synced or synced[c] < recent]
+    failed = []
+    for channel in stale:
+        try:
+            await sync_channel(channel, background=True)
+        except SlackApiError as e:
+            failed.append(f"<#{channel}> (`{slack_error(e)}`)")
+    if stale:
+        logger.info(f"Synced members of {len(stale) - len(failed)} channels")
+    if failed:
+        await send_heartbeat(
+            f"Couldn't sync members of {len(failed)} channels: {', '.join(failed[:20])}"
+        )
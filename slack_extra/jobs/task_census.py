@@ -0,0 +1,13 @@
+import logging
+
+from slack_extra.utils.monitor import take_task_census
+
+logger = logging.getLogger(__name__)
+
+
+async def task_census_job():
+    census = take_task_census()
+    logger.debug(
+        f"{census.total()} asyncio tasks: "
+        + ", ".join(f"{name}={count}" for name, count in census.most_common(10))
+    )
@@ -0,0 +1,220 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.columns import Serial
+from piccolo.columns.column_types import Bytea
+from piccolo.columns.column_types import JSON
+from piccolo.columns.column_types import JSONB
+from piccolo.columns.column_types import Timestamptz
+from piccolo.columns.column_types import Varchar
+from piccolo.columns.defaults.timestamptz import TimestamptzNow
+from piccolo.columns.indexes import IndexMethod
+from piccolo.engine import engine_finder
+
+
+ID = "2026-10-19T10:12:41:503218"
+VERSION = "1.30.0"
+DESCRIPTION = "Unique (channel, message_ts) index and JSONB message on spoiler, add spoiler_archive"
+
+
+async def index_spoilers():
+    engine = engine_finder()
+    # Keep the first row for any spoiler that was somehow recorded twice
+    await engine.run_ddl(
+        "DELETE FROM spoiler a USING spoiler b "
+        "WHERE a.channel = b.channel AND a.message_ts = b.message_ts AND a.id > b.id"
+    )
+    await engine.run_ddl(
+        "CREATE UNIQUE INDEX IF NOT EXISTS spoiler_channel_message_ts "
+        "ON spoiler (channel, message_ts)"
+    )
+    # Piccolo doesn't emit a USING clause for JSON -> JSONB, so cast here; the
+    # alter_column below is then a no-op that keeps the migration snapshot in sync
+    await engine.run_ddl(
+        "ALTER TABLE spoiler ALTER COLUMN message TYPE JSONB USING message::jsonb"
+    )
+
+
+async def unindex_spoilers():
+    engine = engine_finder()
+    await engine.run_ddl("DROP INDEX IF EXISTS spoiler_channel_message_ts")
+    await engine.run_ddl(
+        "ALTER TABLE spoiler ALTER COLUMN message TYPE JSON USING message::json"
+    )
+
+
+async def forwards():
+    manager = MigrationManager(
+        migration_id=ID, app_name="slack_extra", description=DESCRIPTION
+    )
+
+    manager.add_raw(index_spoilers)
+    manager.add_raw_backwards(unindex_spoilers)
+
+    manager.alter_column(
+        table_class_name="Spoiler",
+        tablename="spoiler",
+        column_name="message",
+        db_column_name="message",
+        params={},
+        old_params={},
+        column_class=JSONB,
+        old_column_class=JSON,
+        schema=None,
+    )
+
+    manager.add_table(
+        class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        schema=None,
+        columns=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="id",
+        db_column_name="id",
+        column_class_name="Serial",
+        column_class=Serial,
+        params={
+            "null": False,
+            "primary_key": True,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="channel",
+        db_column_name="channel",
+        column_class_name="Varchar",
+        column_class=Varchar,
+        params={
+            "length": 20,
+            "default": "",
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="message_ts",
+        db_column_name="message_ts",
+        column_class_name="Varchar",
+        column_class=Varchar,
+        params={
+            "length": 20,
+            "default": "",
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="message",
+        db_column_name="message",
+        column_class_name="Bytea",
+        column_class=Bytea,
+        params={
+            "default": b"",
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="user",
+        db_column_name="user",
+        column_class_name="Varchar",
+        column_class=Varchar,
+        params={
+            "length": 20,
+            "default": "",
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="created_at",
+        db_column_name="created_at",
+        column_class_name="Timestamptz",
+        column_class=Timestamptz,
+        params={
+            "default": TimestamptzNow(),
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="SpoilerArchive",
+        tablename="spoiler_archive",
+        column_name="archived_at",
+        db_column_name="archived_at",
+        column_class_name="Timestamptz",
+        column_class=Timestamptz,
+        params={
+            "default": TimestamptzNow(),
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    return manager
@@ -0,0 +1,32 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.engine import engine_finder
+
+
+ID = "2026-10-19T10:13:05:118472"
+VERSION = "1.30.0"
+DESCRIPTION = "Unique (channel, message_ts) index on spoiler_archive"
+
+
+async def index_archive():
+    # Raw queries run before add_table, so this needs the table from the previous migration
+    await engine_finder().run_ddl(
+        "CREATE UNIQUE INDEX IF NOT EXISTS spoiler_archive_channel_message_ts "
+        "ON spoiler_archive (channel, message_ts)"
+    )
+
+
+async def unindex_archive():
+    await engine_finder().run_ddl(
+        "DROP INDEX IF EXISTS spoiler_archive_channel_message_ts"
+    )
+
+
+async def forwards():
+    manager = MigrationManager(
+        migration_id=ID, app_name="slack_extra", description=DESCRIPTION
+    )
+
+    manager.add_raw(index_archive)
+    manager.add_raw_backwards(unindex_archive)
+
+    return manager
@@ -0,0 +1,32 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.engine import engine_finder
+
+
+ID = "2026-10-19T11:02:44:207316"
+VERSION = "1.30.0"
+DESCRIPTION = "Unique (channel, message_ts, user) index on spoiler_click"
+
+
+async def index_clicks():
+    # The click flush upserts on this index
+    await engine_finder().run_ddl(
+        "CREATE UNIQUE INDEX IF NOT EXISTS spoiler_click_channel_message_ts_user "
+        'ON spoiler_click (channel, message_ts, "user")'
+    )
+
+
+async def unindex_clicks():
+    await engine_finder().run_ddl(
+        "DROP INDEX IF EXISTS spoiler_click_channel_message_ts_user"
+    )
+
+
+async def forwards():
+    manager = MigrationManager(
+        migration_id=ID, app_name="slack_extra", description=DESCRIPTION
+    )
+
+    manager.add_raw(index_clicks)
+    manager.add_raw_backwards(unindex_clicks)
+
+    return manager
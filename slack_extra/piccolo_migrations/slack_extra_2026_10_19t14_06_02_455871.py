@@ -0,0 +1,36 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.engine import engine_finder
+
+
+ID = "2026-10-19T14:06:02:455871"
+VERSION = "1.30.0"
+DESCRIPTION = "Indexes on channel_member"
+
+
+async def index_members():
+    engine = engine_finder()
+    await engine.run_ddl(
+        "CREATE UNIQUE INDEX IF NOT EXISTS channel_member_channel_id_user_id "
+        "ON channel_member (channel_id, user_id)"
+    )
+    # For "which of these channels is this user in" lookups
+    await engine.run_ddl(
+        "CREATE INDEX IF NOT EXISTS channel_member_user_id ON channel_member (user_id)"
+    )
+
+
+async def unindex_members():
+    engine = engine_finder()
+    await engine.run_ddl("DROP INDEX IF EXISTS channel_member_channel_id_user_id")
+    await engine.run_ddl("DROP INDEX IF EXISTS channel_member_user_id")
+
+
+async def forwards():
+    manager = MigrationManager(
+        migration_id=ID, app_name="slack_extra", description=DESCRIPTION
+    )
+
+    manager.add_raw(index_members)
+    manager.add_raw_backwards(unindex_members)
+
+    return manager
@@ -2,6 +2,7 @@ from slack_bolt.async_app import AsyncApp
 
 from slack_extra.shortcuts.delete_message import delete_message_handler
 from slack_extra.shortcuts.spoiler import spoiler_handler
+from slack_extra.utils.middleware import instrument
 # from slack_extra.shortcuts.export_reactions import export_reactions_handler
 
 
@@ -17,4 +18,6 @@ SHORTCUTS = [
 
 def register_shortcuts(app: AsyncApp):
     for shortcut in SHORTCUTS:
-        app.shortcut(shortcut["id"])(shortcut["handler"])
+        app.shortcut(shortcut["id"])(
+            instrument("shortcut", shortcut["id"])(shortcut["handler"])
+        )
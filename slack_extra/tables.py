@@ -1,7 +1,9 @@
 from piccolo.columns import Boolean
+from piccolo.columns import Bytea
 from piccolo.columns import ForeignKey
 from piccolo.columns import Integer
 from piccolo.columns import JSON
+from piccolo.columns import JSONB
 from piccolo.columns import Secret
 from piccolo.columns import Serial
 from piccolo.columns import Text
@@ -55,14 +57,46 @@ class AnchorConfig(Table):
 
 
 class Spoiler(Table):
+    # (channel, message_ts) has a unique composite index, created in a raw migration since
+    # Piccolo can't declare one
     id = Serial(primary_key=True)
     channel = Varchar(length=20)
     message_ts = Varchar(length=20)
-    message = JSON()
+    message = JSONB()
     user = Varchar(length=20)
     created_at = Timestamptz()
 
 
+class SpoilerArchive(Table):
+    # Spoilers past the retention period, with `message` stored as zlib-compressed JSON
+    id = Serial(primary_key=True)
+    channel = Varchar(length=20)
+    message_ts = Varchar(length=20)
+    message = Bytea()
+    user = Varchar(length=20)
+    created_at = Timestamptz()
+    archived_at = Timestamptz()
+
+
+class SpoilerClick(Table):
+    # One row per (channel, message_ts, user), unique via a raw index; `clicks` is
+    # incremented by batched upserts from the in-memory click counter
+    id = Serial(primary_key=True)
+    channel = Varchar(length=20)
+    message_ts = Varchar(length=20)
+    user = Varchar(length=20)
+    clicks = Integer(default=0)
+    first_clicked_at = Timestamptz()
+    last_clicked_at = Timestamptz()
+
+
+class ProcessedEvent(Table):
+    # Event ids claimed by any replica, so Slack retries aren't handled twice
+    id = Serial(primary_key=True)
+    event_id = Varchar(length=32, unique=True)
+    received_at = Timestamptz()
+
+
 class MigrationConfig(Table):
     id = Serial(primary_key=True)
     name = Varchar(length=255)
@@ -74,3 +108,35 @@ class MigrationChannel(Table):
     id = Serial(primary_key=True)
     channel_id = Varchar(unique=True)
     config = ForeignKey(references=MigrationConfig)
+
+
+class MoverCheckpoint(Table):
+    # Progress of the background mover reconciler for one group, so it can resume after a
+    # restart. `members` holds the zlib-compressed member lists gathered so far, and
+    # `channel_id`/`cursor` point at the channel being paged when it stopped.
+    id = Serial(primary_key=True)
+    config = ForeignKey(references=MigrationConfig, unique=True)
+    channel_id = Varchar(length=20, null=True)
+    cursor = Text(null=True)
+    members = Bytea(null=True)
+    completed_at = Timestamptz(null=True, default=None)
+    updated_at = Timestamptz()
+
+
+class ChannelMember(Table):
+    # Mirror of channel membership, kept up to date by member_joined_channel and
+    # member_left_channel. (channel_id, user_id) is unique via a raw index. Leaves are kept
+    # as rows with present=false until the next crawl, so a crawl that started before a
+    # join or leave can't undo it.
+    id = Serial(primary_key=True)
+    channel_id = Varchar(length=20)
+    user_id = Varchar(length=20)
+    present = Boolean(default=True)
+    changed_at = Timestamptz()
+
+
+class ChannelMemberSync(Table):
+    # Channels whose ChannelMember rows came from a full crawl and can be trusted
+    id = Serial(primary_key=True)
+    channel_id = Varchar(length=20, unique=True)
+    synced_at = Timestamptz()
@@ -0,0 +1,24 @@
+from slack_extra.tables import AnchorConfig
+
+# Channels with an enabled anchor, so message events elsewhere can be dropped without a
+# database lookup. Loaded at startup and kept current by the anchor handlers.
+_anchored: set[str] = set()
+
+
+async def load_anchored_channels():
+    rows = await AnchorConfig.select(AnchorConfig.channel_id).where(
+        AnchorConfig.enabled.eq(True)
+    )
+    _anchored.clear()
+    _anchored.update(row["channel_id"] for row in rows)
+
+
+def is_anchored(channel: str) -> bool:
+    return channel in _anchored
+
+
+def set_anchored(channel: str, enabled: bool):
+    if enabled:
+        _anchored.add(channel)
+    else:
+        _anchored.discard(channel)
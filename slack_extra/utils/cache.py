@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from time import monotonic
+
+
+class LRUCache[K, V]:
+    """A bounded mapping that evicts the least recently used entry once full."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        return self._data.pop(key, None)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache[K, V]:
+    """A bounded mapping whose entries expire `ttl` seconds after they were last set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Every entry shares the same TTL, so insertion order is also expiry order
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def _expire(self):
+        now = monotonic()
+        while self._data:
+            key, (expires, _) = next(iter(self._data.items()))
+            if expires > now:
+                break
+            del self._data[key]
+
+    def get(self, key: K) -> V | None:
+        self._expire()
+        entry = self._data.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: K, value: V):
+        self._data[key] = (monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        self._expire()
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry and entry[0] > monotonic() else None
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
@@ -0,0 +1,104 @@
+import asyncio
+
+from slack_extra.config import config
+from slack_extra.tables import ChannelMember
+from slack_extra.utils.cache import TTLCache
+from slack_extra.utils.members import add_member
+from slack_extra.utils.members import forget_channel
+
+# Channels the bot is in. Persisted as the bot's own rows in the membership mirror, loaded at
+# startup and replaced by every sync_members run.
+_joined: set[str] = set()
+
+# conversations.info channel objects. Creator, type and creation time don't change; the rest
+# is invalidated by channel events.
+channel_info_cache: TTLCache[str, dict] = TTLCache(
+    maxsize=config.channels.info_cache_size, ttl=config.channels.info_ttl
+)
+_fetching: dict[str, asyncio.Task] = {}
+
+
+async def _fetch_channel_info(channel: str) -> dict:
+    from slack_extra.env import env
+
+    res = await env.slack_client.conversations_info(channel=channel)
+    info = res.get("channel", {})
+    # Don't cache a result that was invalidated while the request was in flight
+    if _fetching.get(channel) is asyncio.current_task():
+        channel_info_cache.set(channel, info)
+    return info
+
+
+async def get_channel_info(channel: str) -> dict:
+    """
+    The channel object from `conversations.info`, cached. Concurrent misses for the same
+    channel share one request. Raises `SlackApiError` like the API call.
+    """
+    info = channel_info_cache.get(channel)
+    if info is not None:
+        return info
+
+    task = _fetching.get(channel)
+    if not task:
+        task = asyncio.create_task(_fetch_channel_info(channel))
+        _fetching[channel] = task
+
+        def done(_):
+            if _fetching.get(channel) is task:
+                del _fetching[channel]
+
+        task.add_done_callback(done)
+    return await asyncio.shield(task)
+
+
+def invalidate_channel_info(channel: str):
+    channel_info_cache.pop(channel)
+    _fetching.pop(channel, None)
+
+
+async def load_joined_channels():
+    from slack_extra.env import env
+
+    rows = await ChannelMember.select(ChannelMember.channel_id).where(
+        (ChannelMember.user_id == env.bot_user_id) & ChannelMember.present.eq(True)
+    )
+    _joined.update(row["channel_id"] for row in rows)
+
+
+def replace_joined_channels(channels: set[str]):
+    _joined.clear()
+    _joined.update(channels)
+
+
+def is_joined(channel: str) -> bool:
+    return channel in _joined
+
+
+async def mark_joined(channel: str):
+    from slack_extra.env import env
+
+    if channel not in _joined:
+        _joined.add(channel)
+        # The cached is_member is stale now
+        invalidate_channel_info(channel)
+        await add_member(channel, env.bot_user_id)
+
+
+async def mark_left(channel: str):
+    _joined.discard(channel)
+    invalidate_channel_info(channel)
+    # We stop getting join/leave events for the channel, so its mirror would go stale
+    await forget_channel(channel)
+
+
+async def ensure_joined(channel: str):
+    """
+    Join a channel unless the bot is already in it, which needs no Slack call. Raises
+    `SlackApiError` when the join fails.
+    """
+    from slack_extra.env import env
+
+    if channel in _joined:
+        return
+    await env.slack_client.conversations_join(channel=channel)
+    await mark_joined(channel)
@@ -0,0 +1,110 @@
+import asyncio
+from time import perf_counter
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+from slack_extra.config import config
+from slack_extra.utils.deadline import remaining
+from slack_extra.utils.lanes import current_lane
+from slack_extra.utils.lanes import LANES
+from slack_extra.utils.metrics import Counter
+from slack_extra.utils.metrics import Histogram
+from slack_extra.utils.ratelimit import PriorityLimiter
+
+API_CALL_SECONDS = Histogram(
+    "slack_extra_slack_api_call_seconds",
+    "Latency of Slack Web API calls",
+    ("method",),
+)
+API_CALLS = Counter(
+    "slack_extra_slack_api_calls_total",
+    "Slack Web API calls by method and result",
+    ("method", "result"),
+)
+API_QUEUE_SECONDS = Histogram(
+    "slack_extra_slack_api_queue_seconds",
+    "Time Slack Web API calls waited for a concurrency slot",
+    ("lane",),
+)
+
+# Methods that spend a trigger_id, which is only valid until the request's deadline
+TRIGGER_METHODS = {"views.open", "views.push", "dialog.open"}
+
+
+def slack_error(e: SlackApiError) -> str:
+    """The Slack error code of a failed call, or the HTTP status for non-JSON responses."""
+    data = e.response.data
+    error = data.get("error") if isinstance(data, dict) else None
+    return error or f"http_{e.response.status_code}"
+
+
+class DeadlineExceeded(SlackApiError):
+    """A trigger method cut off at the request's deadline.
+
+    Raised in place of `TimeoutError` so handlers' usual `except SlackApiError` covers it;
+    the response carries the `expired_trigger_id` error Slack itself would have given.
+    """
+
+    def __init__(self, client: AsyncWebClient, api_method: str):
+        response = AsyncSlackResponse(
+            client=client,
+            http_verb="POST",
+            api_url=client.base_url + api_method,
+            req_args={},
+            data={"ok": False, "error": "expired_trigger_id"},
+            headers={},
+            status_code=200,
+        )
+        super().__init__(f"{api_method} passed the request deadline", response)
+
+
+# Shared by every client so the cap covers all outbound traffic
+api_slots = PriorityLimiter(
+    slots=config.api.max_concurrency,
+    reserved=config.api.interactive_reserved,
+    lanes=LANES,
+    max_wait=config.api.max_wait,
+)
+
+
+class InstrumentedWebClient(AsyncWebClient):
+    """AsyncWebClient that records per-method call counts and latency."""
+
+    @classmethod
+    def from_client(cls, client: AsyncWebClient) -> "InstrumentedWebClient":
+        # Bolt builds a plain AsyncWebClient for every request; reuse its settings as-is
+        instrumented = cls.__new__(cls)
+        instrumented.__dict__.update(client.__dict__)
+        return instrumented
+
+    async def api_call(self, api_method: str, **kwargs) -> AsyncSlackResponse:
+        result = "ok"
+        lane = current_lane()
+        queued = perf_counter()
+        # Only set once we hold a slot, so call latency doesn't include queueing
+        start = None
+        # Past the deadline Slack rejects the trigger_id anyway, so don't wait longer
+        limit = remaining() if api_method in TRIGGER_METHODS else None
+        deadline = asyncio.timeout(limit)
+        try:
+            async with deadline, api_slots.slot(lane):
+                start = perf_counter()
+                API_QUEUE_SECONDS.observe(start - queued, lane=lane)
+                return await super().api_call(api_method, **kwargs)
+        except SlackApiError as e:
+            result = slack_error(e)
+            raise
+        except TimeoutError as e:
+            result = "timeout"
+            if deadline.expired():
+                raise DeadlineExceeded(self, api_method) from e
+            raise
+        except Exception:
+            result = "exception"
+            raise
+        finally:
+            if start is not None:
+                API_CALL_SECONDS.observe(perf_counter() - start, method=api_method)
+            API_CALLS.inc(method=api_method, result=result)
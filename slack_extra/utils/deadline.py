@@ -0,0 +1,41 @@
+import asyncio
+from contextvars import ContextVar
+from time import monotonic
+
+# Slack shows the user an error if a request isn't answered within three seconds, and
+# trigger_ids expire after the same time
+SLACK_BUDGET = 3.0
+
+# When the response to the request being handled stops mattering (monotonic time), or None
+# outside of a request, e.g. in background jobs
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def start_deadline(budget: float = SLACK_BUDGET):
+    """Start the clock for the current request; tasks it creates inherit the deadline."""
+    _deadline.set(monotonic() + budget)
+
+
+def remaining() -> float | None:
+    """Seconds left before the deadline (negative once past it), or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def budget(default: float) -> float:
+    """A timeout for a call: `default`, cut short to the time left before the deadline."""
+    left = remaining()
+    if left is None:
+        return default
+    # Zero would mean "no timeout" to aiohttp
+    return max(min(default, left), 0.01)
+
+
+def within_deadline() -> asyncio.Timeout:
+    """Cancel the enclosed work with `TimeoutError` at the deadline, e.g. for a DB query."""
+    return asyncio.timeout(remaining())
@@ -0,0 +1,59 @@
+import logging
+
+from slack_bolt.response import BoltResponse
+
+from slack_extra.config import config
+from slack_extra.tables import ProcessedEvent
+from slack_extra.utils.cache import LRUCache
+from slack_extra.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_EVENTS = Counter(
+    "slack_extra_duplicate_events_total",
+    "Slack event deliveries dropped because the event_id was already handled",
+    ("type", "source"),
+)
+
+
+class EventDeduplicator:
+    """
+    Remembers recently handled event ids so Slack's retries aren't processed twice. The
+    in-memory set covers a single replica; with `EVENTS__DEDUP_SHARED` the event id is also
+    claimed in Postgres so retries landing on another replica are dropped too.
+    """
+
+    def __init__(self):
+        self._seen: LRUCache[str, bool] = LRUCache(config.events.dedup_cache_size)
+
+    async def claim(self, event_id: str) -> str | None:
+        """Claim an event id, returning where it was already seen or None if it's new."""
+        if event_id in self._seen:
+            return "memory"
+        self._seen.set(event_id, True)
+        if not config.events.dedup_shared:
+            return None
+        try:
+            inserted = await ProcessedEvent.insert(
+                ProcessedEvent(event_id=event_id)
+            ).on_conflict(action="DO NOTHING")
+        except Exception:
+            # Handling an event twice is better than dropping it
+            logger.exception(f"Couldn't claim event {event_id} in Postgres")
+            return None
+        return None if inserted else "postgres"
+
+
+deduplicator = EventDeduplicator()
+
+
+async def dedup_events_middleware(body: dict, next):
+    event_id = body.get("event_id")
+    if body.get("type") == "event_callback" and event_id:
+        source = await deduplicator.claim(event_id)
+        if source:
+            event_type = body.get("event", {}).get("type", "")
+            DUPLICATE_EVENTS.inc(type=event_type, source=source)
+            logger.debug(f"Dropped duplicate {event_type} event {event_id}")
+            return BoltResponse(status=200, body="")
+    await next()
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from time import perf_counter
+
+from slack_extra.config import config
+from slack_extra.utils.lanes import use_lane
+from slack_extra.utils.metrics import Counter
+from slack_extra.utils.metrics import Gauge
+from slack_extra.utils.metrics import Histogram
+from slack_extra.utils.middleware import track_listener
+
+logger = logging.getLogger(__name__)
+
+QUEUE_DEPTH = Gauge(
+    "slack_extra_event_queue_depth",
+    "Acknowledged events waiting for a worker",
+)
+QUEUE_WAIT_SECONDS = Histogram(
+    "slack_extra_event_queue_wait_seconds",
+    "Time acknowledged events spent queued before a worker picked them up",
+    ("name",),
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+QUEUE_DROPPED = Counter(
+    "slack_extra_event_queue_dropped_total",
+    "Queued event work abandoned at shutdown",
+)
+
+
+class EventQueue:
+    """
+    Work for events that have already been acknowledged, run by a fixed pool of workers so
+    slow Slack calls neither hold up Slack's request nor pile up as unbounded tasks. When
+    the queue is full, `put` waits for room.
+    """
+
+    def __init__(self):
+        self.workers = config.events.queue_workers
+        self.drain_timeout = config.events.drain_timeout
+        self._queue: asyncio.Queue = asyncio.Queue(config.events.queue_size)
+        self._tasks: list[asyncio.Task] = []
+        # Queued plus running, i.e. what drain would still have to wait for
+        self._pending = 0
+
+    def start(self):
+        for i in range(self.workers):
+            self._tasks.append(
+                asyncio.create_task(self._work(), name=f"event-worker:{i}")
+            )
+
+    async def put(self, name: str, handler, *args):
+        """Run `await handler(*args)` on a worker; `name` labels its metrics."""
+        await self._queue.put((name, handler, args, perf_counter()))
+        self._pending += 1
+        QUEUE_DEPTH.set(self._queue.qsize())
+
+    async def _work(self):
+        while True:
+            name, handler, args, queued_at = await self._queue.get()
+            QUEUE_DEPTH.set(self._queue.qsize())
+            QUEUE_WAIT_SECONDS.observe(perf_counter() - queued_at, name=name)
+            try:
+                # Workers outlive the request that queued the work, so set its lane here
+                with use_lane("event"), track_listener("queued", name):
+                    await handler(*args)
+            except Exception:
+                logger.exception(f"Queued work for event {name} failed")
+            finally:
+                self._pending -= 1
+                self._queue.task_done()
+
+    async def drain(self):
+        """Finish queued work, up to `drain_timeout` seconds, then stop the workers."""
+        try:
+            async with asyncio.timeout(self.drain_timeout):
+                await self._queue.join()
+        except TimeoutError:
+            QUEUE_DROPPED.inc(self._pending)
+            logger.warning(
+                f"Abandoning {self._pending} queued events after {self.drain_timeout}s"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+event_queue = EventQueue()
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+from typing import Any
+from typing import Callable
+
+from slack_extra.config import config
+
+logger = logging.getLogger(__name__)
+
+_executor: Executor | None = None
+
+
+def get_executor() -> Executor:
+    """Return the shared worker pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        if config.workers.kind == "process":
+            _executor = ProcessPoolExecutor(max_workers=config.workers.max_workers)
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.workers.max_workers,
+                thread_name_prefix="slack-extra-worker",
+            )
+        logger.debug(
+            f"Started {config.workers.kind} worker pool (max_workers={config.workers.max_workers})"
+        )
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+class LoopLagProbe:
+    """Measures how late the event loop wakes up from short sleeps while it is running."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.max_lag = max(self.max_lag, loop.time() - expected)
+
+    async def stop(self) -> float:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return self.max_lag
+
+
+async def run_cpu_bound(
+    func: Callable[..., Any], *args: Any, size: int, name: str | None = None
+) -> Any:
+    """
+    Run a CPU-bound function. Inputs under `config.workers.offload_threshold` bytes are run inline,
+    since handing them to the pool costs more than the work itself; larger ones run on the worker
+    pool so the event loop keeps serving other requests.
+
+    With a process pool, `func` and its arguments must be picklable (module-level functions and
+    plain JSON-like data).
+    """
+    if size < config.workers.offload_threshold:
+        return func(*args)
+
+    loop = asyncio.get_running_loop()
+    name = name or getattr(func, "__name__", repr(func))
+    probe = LoopLagProbe()
+    probe.start()
+    st = perf_counter()
+    try:
+        return await loop.run_in_executor(get_executor(), partial(func, *args))
+    finally:
+        lag = await probe.stop()
+        logger.debug(
+            f"{name} ({size} bytes) ran on the worker pool in {perf_counter() - st:.3f}s, max event loop lag {lag * 1000:.1f}ms"
+        )
@@ -0,0 +1,38 @@
+from slack_extra.events.message.anchor import ANCHOR_SUBTYPES
+from slack_extra.events.message.channel_info import CHANNEL_SUBTYPES
+from slack_extra.utils.anchors import is_anchored
+from slack_extra.utils.metrics import Counter
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+EVENTS_DROPPED = Counter(
+    "slack_extra_events_dropped_total",
+    "Message events answered before reaching Bolt because no listener acts on them",
+)
+
+
+def should_drop(body: bytes) -> bool:
+    """
+    Whether a request is a message event no listener would act on: not a channel metadata
+    change, and not activity in a channel with an enabled anchor. Only Events API payloads
+    are JSON; commands and interactions are form encoded and always pass.
+    """
+    if not body.startswith(b"{"):
+        return False
+    try:
+        payload = loads(body)
+    except ValueError:
+        return False
+    if payload.get("type") != "event_callback":
+        return False
+    event = payload.get("event") or {}
+    if event.get("type") != "message":
+        return False
+
+    subtype = event.get("subtype")
+    if subtype in CHANNEL_SUBTYPES:
+        return False
+    return subtype not in ANCHOR_SUBTYPES or not is_anchored(event.get("channel", ""))
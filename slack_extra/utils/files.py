@@ -0,0 +1,102 @@
+import asyncio
+import contextlib
+import logging
+from tempfile import SpooledTemporaryFile
+
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_extra.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class FileRelayError(Exception):
+    def __init__(self, file: dict, reason: str):
+        super().__init__(f"Failed to relay {file.get('name')}: {reason}")
+        self.file = file
+
+
+class ByteBudget:
+    """Caps the number of bytes held by in-flight file relays across the process."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, size: int):
+        async with self._cond:
+            # A file bigger than the whole budget still gets through once nothing else is in flight
+            await self._cond.wait_for(
+                lambda: self.in_flight == 0 or self.in_flight + size <= self.limit
+            )
+            self.in_flight += size
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self.in_flight -= size
+                self._cond.notify_all()
+
+
+budget = ByteBudget(config.file_relay.max_in_flight_bytes)
+
+
+async def relay_file(file: dict, client: AsyncWebClient) -> dict[str, str]:
+    """
+    Copy a file shared with the app into a new, not yet shared, upload.
+
+    The file is streamed into a temp file that only stays in memory up to
+    `config.file_relay.spool_memory_bytes`, then streamed to the upload URL from
+    `files.getUploadURLExternal`. Returns the `{"id", "title"}` entry to pass to
+    `files_completeUploadExternal` once the upload should be shared.
+    """
+    from slack_extra.env import env
+
+    name = file["name"]
+    # Without a size we can't know what the file will hold, so it waits for the whole
+    # budget rather than slipping past it
+    async with budget.reserve(file.get("size") or budget.limit):
+        with SpooledTemporaryFile(
+            max_size=config.file_relay.spool_memory_bytes
+        ) as spool:
+            async with env.http.get(
+                file["url_private_download"],
+                headers={"Authorization": f"Bearer {config.slack.bot_token}"},
+            ) as resp:
+                if resp.status != 200:
+                    raise FileRelayError(file, f"download returned {resp.status}")
+                async for chunk in resp.content.iter_chunked(
+                    config.file_relay.chunk_size
+                ):
+                    spool.write(chunk)
+
+            length = spool.tell()
+            spool.seek(0)
+            upload = await client.files_getUploadURLExternal(
+                filename=name, length=length
+            )
+            async with env.http.post(upload["upload_url"], data=spool) as resp:
+                if resp.status != 200:
+                    raise FileRelayError(file, f"upload returned {resp.status}")
+
+    logger.debug(f"Relayed {name} ({length} bytes) as {upload['file_id']}")
+    return {"id": upload["file_id"], "title": name}
+
+
+async def relay_files(
+    files: list[dict], client: AsyncWebClient
+) -> list[dict[str, str]]:
+    """
+    Relay several files concurrently, keeping their order. If any file fails, the others are
+    cancelled and the first error is raised.
+    """
+    tasks = [asyncio.create_task(relay_file(f, client)) for f in files]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime
+from datetime import timezone
+from time import monotonic
+from time import perf_counter
+from typing import Awaitable
+from typing import Callable
+
+from piccolo.engine import engine_finder
+
+from slack_extra.config import config
+from slack_extra.utils.metrics import Gauge
+from slack_extra.utils.monitor import loop_monitor
+
+DEPENDENCY_UP = Gauge(
+    "slack_extra_dependency_up",
+    "Whether the last health probe of a dependency succeeded",
+    ("dependency",),
+)
+DEPENDENCY_LATENCY = Gauge(
+    "slack_extra_dependency_latency_seconds",
+    "Latency of the last health probe of a dependency",
+    ("dependency",),
+)
+
+
+async def _check_slack() -> dict:
+    from slack_extra.env import env
+
+    await env.slack_client.api_test()
+    return {}
+
+
+async def _check_postgres() -> dict:
+    await engine_finder().run_ddl("SELECT 1")
+    return {}
+
+
+async def _check_pool() -> dict:
+    pool = engine_finder().pool
+    if pool is None:
+        raise RuntimeError("connection pool not started")
+    async with pool.acquire():
+        pass
+    return {
+        "size": pool.get_size(),
+        "idle": pool.get_idle_size(),
+        "max": pool.get_max_size(),
+    }
+
+
+CHECKS: dict[str, Callable[[], Awaitable[dict]]] = {
+    "slack": _check_slack,
+    "postgres": _check_postgres,
+    "pool": _check_pool,
+}
+
+
+class HealthChecker:
+    """Holds the latest results of the background health probe so routes never do I/O."""
+
+    def __init__(self):
+        self.results: dict[str, dict] = {}
+        self.checked_at: datetime | None = None
+        self._checked_monotonic: float | None = None
+
+    async def _run_check(self, name: str) -> dict:
+        start = perf_counter()
+        try:
+            extra = await asyncio.wait_for(CHECKS[name](), config.health.timeout)
+            result = {"healthy": True, **extra}
+        except Exception as e:
+            result = {"healthy": False, "error": str(e) or type(e).__name__}
+        latency = perf_counter() - start
+        DEPENDENCY_UP.set(int(result["healthy"]), dependency=name)
+        DEPENDENCY_LATENCY.set(latency, dependency=name)
+        return {**result, "latency_ms": round(latency * 1000, 1)}
+
+    async def probe(self):
+        results = await asyncio.gather(*[self._run_check(name) for name in CHECKS])
+        self.results = dict(zip(CHECKS, results))
+        self.checked_at = datetime.now(timezone.utc)
+        self._checked_monotonic = monotonic()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the prober has stopped running, which means the loop is starved."""
+        if self._checked_monotonic is None:
+            return False
+        return monotonic() - self._checked_monotonic > config.health.probe_interval * 3
+
+    @property
+    def ready(self) -> bool:
+        return (
+            self.checked_at is not None
+            and not self.stale
+            and all(result["healthy"] for result in self.results.values())
+        )
+
+    def report(self) -> dict:
+        return {
+            "ready": self.ready,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "loop_lag_ms": round(loop_monitor.last_lag * 1000, 1),
+            "dependencies": self.results,
+        }
+
+
+health_checker = HealthChecker()
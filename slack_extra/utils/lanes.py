@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Outbound Slack traffic classes, most important first
+LANES = ("interactive", "event", "bulk", "telemetry")
+
+# Requests set their lane in middleware; work outside of a request (jobs) is bulk
+_lane: ContextVar[str] = ContextVar("lane", default="bulk")
+
+
+def current_lane() -> str:
+    return _lane.get()
+
+
+def set_lane(lane: str):
+    """Set the lane for the rest of the current request, including tasks it creates."""
+    _lane.set(lane)
+
+
+@contextmanager
+def use_lane(lane: str):
+    """Send the Slack calls made inside the block in another lane."""
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
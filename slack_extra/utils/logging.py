@@ -1,23 +1,53 @@
+import asyncio
+import logging
+
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.config import config
+from slack_extra.utils.lanes import use_lane
 
+logger = logging.getLogger(__name__)
 
-async def send_heartbeat(
-    heartbeat: str, messages: list[str] = [], client: AsyncWebClient | None = None
-):
-    if not client:
-        from slack_extra.env import env
+# Heartbeats still being posted, so shutdown can wait for them
+_sending: set[asyncio.Task] = set()
 
-        client = env.slack_client
-    if config.slack.heartbeat_channel:
-        msg = await client.chat_postMessage(
-            channel=config.slack.heartbeat_channel, text=heartbeat
-        )
-        if messages:
+
+async def _post_heartbeat(heartbeat: str, messages: list[str], client: AsyncWebClient):
+    try:
+        # Heartbeats are for us, so they go behind anything a user is waiting on
+        with use_lane("telemetry"):
+            msg = await client.chat_postMessage(
+                channel=config.slack.heartbeat_channel, text=heartbeat
+            )
             for message in messages:
                 await client.chat_postMessage(
                     channel=config.slack.heartbeat_channel,
                     text=message,
                     thread_ts=msg["ts"],
                 )
+    except Exception:
+        logger.exception(f"Failed to send heartbeat: {heartbeat}")
+
+
+async def send_heartbeat(
+    heartbeat: str, messages: list[str] = [], client: AsyncWebClient | None = None
+):
+    """
+    Post to the heartbeat channel in the background. The telemetry lane waits behind other
+    Slack traffic, so callers never wait on it.
+    """
+    if not config.slack.heartbeat_channel:
+        return
+    if not client:
+        from slack_extra.env import env
+
+        client = env.slack_client
+    task = asyncio.create_task(_post_heartbeat(heartbeat, list(messages), client))
+    _sending.add(task)
+    task.add_done_callback(_sending.discard)
+
+
+async def flush_heartbeats(timeout: float = 5):
+    """Give heartbeats still being posted a chance to finish, e.g. on shutdown."""
+    if _sending:
+        await asyncio.wait(_sending, timeout=timeout)
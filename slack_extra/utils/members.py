@@ -0,0 +1,194 @@
+import asyncio
+import logging
+from datetime import datetime
+from datetime import timezone
+
+from slack_extra.config import config
+from slack_extra.tables import ChannelMember
+from slack_extra.tables import ChannelMemberSync
+from slack_extra.utils.ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# conversations.members is Tier 4 (~100/min), shared by the background crawl and commands
+# that need a channel mirrored right away. Separate buckets keep a long background crawl
+# from queueing a command's crawl behind it.
+limiter = RateLimiter(rate=config.members.sync_rate, burst=5)
+demand_limiter = RateLimiter(rate=config.members.demand_rate, burst=5)
+
+# Rows changed after the crawl started came from join/leave events the crawl may not have
+# seen, so the crawl leaves them alone. Sent as arrays so big channels don't run into
+# asyncpg's parameter limit.
+_UPSERT_CRAWLED = """
+INSERT INTO channel_member (channel_id, user_id, present, changed_at)
+SELECT {}, unnest({}::varchar[]), true, {}
+ON CONFLICT (channel_id, user_id) DO UPDATE
+SET present = true, changed_at = EXCLUDED.changed_at
+WHERE channel_member.changed_at < EXCLUDED.changed_at
+"""
+
+_DELETE_UNCRAWLED = """
+DELETE FROM channel_member
+WHERE channel_id = {} AND changed_at < {} AND NOT (user_id = ANY({}::varchar[]))
+"""
+
+_SET_MEMBER = """
+INSERT INTO channel_member (channel_id, user_id, present, changed_at)
+VALUES ({}, {}, {}, {})
+ON CONFLICT (channel_id, user_id) DO UPDATE
+SET present = EXCLUDED.present, changed_at = EXCLUDED.changed_at
+"""
+
+_MARK_SYNCED = """
+INSERT INTO channel_member_sync (channel_id, synced_at) VALUES ({}, {})
+ON CONFLICT (channel_id) DO UPDATE SET synced_at = EXCLUDED.synced_at
+"""
+
+_DIFFERENCE = """
+SELECT user_id FROM channel_member WHERE channel_id = {} AND present
+EXCEPT
+SELECT user_id FROM channel_member WHERE channel_id = {} AND present
+"""
+
+_syncing: dict[str, asyncio.Task] = {}
+
+
+async def _crawl(channel: str, limiter: RateLimiter) -> set[str]:
+    from slack_extra.env import env
+
+    started = datetime.now(timezone.utc)
+    members = set()
+    cursor = None
+    while True:
+        page = await limiter.call(
+            env.slack_client.conversations_members,
+            channel=channel,
+            cursor=cursor,
+            limit=1000,
+        )
+        members.update(page.get("members", []))
+        cursor = (page.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            break
+
+    async with ChannelMember._meta.db.transaction():
+        await ChannelMember.raw(_UPSERT_CRAWLED, channel, list(members), started)
+        await ChannelMember.raw(_DELETE_UNCRAWLED, channel, started, list(members))
+        await ChannelMemberSync.raw(_MARK_SYNCED, channel, started)
+    logger.debug(f"Synced {len(members)} members of {channel}")
+    return members
+
+
+async def sync_channel(channel: str, background: bool = False) -> set[str]:
+    """
+    Update the mirror of a channel from a fresh crawl of `conversations.members`, keeping
+    joins and leaves that happened during it. Concurrent calls for the same channel share
+    one crawl. `background` crawls are paced for the sync job rather than a waiting user.
+    """
+    task = _syncing.get(channel)
+    if not task:
+        task = asyncio.create_task(
+            _crawl(channel, limiter if background else demand_limiter)
+        )
+        _syncing[channel] = task
+        task.add_done_callback(lambda _: _syncing.pop(channel, None))
+    return await asyncio.shield(task)
+
+
+async def forget_channel(channel: str):
+    """Drop a channel from the mirror, e.g. once we stop getting its join/leave events."""
+    async with ChannelMember._meta.db.transaction():
+        await ChannelMember.delete().where(ChannelMember.channel_id == channel)
+        await ChannelMemberSync.delete().where(ChannelMemberSync.channel_id == channel)
+
+
+async def is_synced(channel: str) -> bool:
+    return await ChannelMemberSync.exists().where(
+        ChannelMemberSync.channel_id == channel
+    )
+
+
+async def _ensure_synced(*channels: str):
+    synced = {
+        row["channel_id"]
+        for row in await ChannelMemberSync.select(ChannelMemberSync.channel_id).where(
+            ChannelMemberSync.channel_id.is_in(list(channels))
+        )
+    }
+    await asyncio.gather(*(sync_channel(channel) for channel in set(channels) - synced))
+
+
+async def get_members(channel: str) -> set[str]:
+    """All members of a channel, crawling it first if it isn't mirrored yet."""
+    await _ensure_synced(channel)
+    return {
+        row["user_id"]
+        for row in await ChannelMember.select(ChannelMember.user_id).where(
+            (ChannelMember.channel_id == channel) & ChannelMember.present.eq(True)
+        )
+    }
+
+
+async def is_member(user: str, channel: str) -> bool | None:
+    """Whether the user is in the channel, or None if the channel isn't mirrored."""
+    if not await is_synced(channel):
+        return None
+    return await ChannelMember.exists().where(
+        (ChannelMember.channel_id == channel)
+        & (ChannelMember.user_id == user)
+        & ChannelMember.present.eq(True)
+    )
+
+
+async def count_members(channel: str) -> int | None:
+    """Number of members in the channel, or None if it isn't mirrored."""
+    if not await is_synced(channel):
+        return None
+    return await ChannelMember.count().where(
+        (ChannelMember.channel_id == channel) & ChannelMember.present.eq(True)
+    )
+
+
+async def difference(channel: str, other: str) -> set[str]:
+    """Members of `channel` who aren't in `other`."""
+    await _ensure_synced(channel, other)
+    rows = await ChannelMember.raw(_DIFFERENCE, channel, other)
+    return {row["user_id"] for row in rows}
+
+
+async def union(channels: list[str]) -> set[str]:
+    """Everyone who is in at least one of the channels."""
+    if not channels:
+        return set()
+    await _ensure_synced(*channels)
+    rows = (
+        await ChannelMember.select(ChannelMember.user_id)
+        .where(
+            ChannelMember.channel_id.is_in(channels) & ChannelMember.present.eq(True)
+        )
+        .distinct()
+    )
+    return {row["user_id"] for row in rows}
+
+
+async def channels_with_member(user: str, channels: list[str]) -> set[str]:
+    """Which of the (mirrored) channels the user is in."""
+    rows = await ChannelMember.select(ChannelMember.channel_id).where(
+        (ChannelMember.user_id == user)
+        & ChannelMember.channel_id.is_in(channels)
+        & ChannelMember.present.eq(True)
+    )
+    return {row["channel_id"] for row in rows}
+
+
+async def add_member(channel: str, user: str):
+    await ChannelMember.raw(
+        _SET_MEMBER, channel, user, True, datetime.now(timezone.utc)
+    )
+
+
+async def remove_member(channel: str, user: str):
+    # Kept as a tombstone so a crawl already in flight doesn't bring the user back
+    await ChannelMember.raw(
+        _SET_MEMBER, channel, user, False, datetime.now(timezone.utc)
+    )
@@ -0,0 +1,111 @@
+import functools
+from contextlib import contextmanager
+from time import perf_counter
+
+from slack_bolt.async_app import AsyncAck
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.context.async_context import AsyncBoltContext
+from slack_bolt.response import BoltResponse
+
+from slack_extra.utils.client import InstrumentedWebClient
+from slack_extra.utils.deadline import start_deadline
+from slack_extra.utils.dedup import dedup_events_middleware
+from slack_extra.utils.lanes import set_lane
+from slack_extra.utils.metrics import Counter
+from slack_extra.utils.metrics import Histogram
+
+ACK_SECONDS = Histogram(
+    "slack_extra_ack_seconds",
+    "Time from Bolt receiving a request to the listener acknowledging it",
+    ("kind", "name"),
+)
+LISTENER_SECONDS = Histogram(
+    "slack_extra_listener_seconds",
+    "Total time spent in a listener, including work after ack",
+    ("kind", "name"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+LISTENER_ERRORS = Counter(
+    "slack_extra_listener_errors_total",
+    "Listeners that raised an exception",
+    ("kind", "name"),
+)
+
+
+def describe_request(body: dict) -> tuple[str, str]:
+    """Return a (kind, name) pair identifying which listener a request is for."""
+    if "command" in body:
+        return "command", body["command"]
+    match body.get("type"):
+        case "block_actions":
+            actions = body.get("actions") or [{}]
+            return "action", actions[0].get("action_id", "")
+        case "view_submission" | "view_closed":
+            return "view", body.get("view", {}).get("callback_id", "")
+        case "shortcut" | "message_action":
+            return "shortcut", body.get("callback_id", "")
+        case "event_callback":
+            return "event", body.get("event", {}).get("type", "")
+        case other:
+            return "other", other or ""
+
+
+@contextmanager
+def track_listener(kind: str, name: str):
+    start = perf_counter()
+    try:
+        yield
+    except Exception:
+        LISTENER_ERRORS.inc(kind=kind, name=name)
+        raise
+    finally:
+        LISTENER_SECONDS.observe(perf_counter() - start, kind=kind, name=name)
+
+
+def instrument(kind: str, name: str):
+    """Wrap a Bolt listener so its full run time is recorded."""
+
+    def decorator(handler):
+        # Bolt inspects the unwrapped signature to decide which arguments to pass
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            with track_listener(kind, name):
+                return await handler(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TimedAck(AsyncAck):
+    """AsyncAck that records how long the listener took to acknowledge the request."""
+
+    def __init__(self, kind: str, name: str):
+        super().__init__()
+        self.kind = kind
+        self.name = name
+        self.start = perf_counter()
+
+    async def __call__(self, *args, **kwargs) -> BoltResponse:
+        if self.response is None:
+            ACK_SECONDS.observe(
+                perf_counter() - self.start, kind=self.kind, name=self.name
+            )
+        return await super().__call__(*args, **kwargs)
+
+
+def register_middleware(app: AsyncApp):
+    # Drop Slack's retries before anything else runs
+    app.middleware(dedup_events_middleware)
+
+    @app.middleware
+    async def metrics_middleware(context: AsyncBoltContext, body: dict, next):
+        # Global middleware finishes before the listener runs, so timing happens in the
+        # ack and the listener wrappers rather than around next()
+        start_deadline()
+        kind, name = describe_request(body)
+        # Listeners run in tasks created after this, so they inherit the lane
+        set_lane("event" if kind in ("event", "other") else "interactive")
+        context["ack"] = TimedAck(kind, name)
+        context["client"] = InstrumentedWebClient.from_client(context.client)
+        await next()
@@ -0,0 +1,59 @@
+from blockkit import Modal
+from blockkit import Section
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_extra.utils.client import slack_error
+
+
+class LoadingModal:
+    """A placeholder modal that's already open, to be replaced once the real view is ready."""
+
+    def __init__(self, client: AsyncWebClient, view: dict):
+        self.client = client
+        self.view_id = view["id"]
+        self.hash = view.get("hash")
+        self.closed = False
+
+    async def update(self, view: dict):
+        if self.closed:
+            return
+        # The hash stops us overwriting a view the user has moved on from
+        try:
+            res = await self.client.views_update(
+                view_id=self.view_id, hash=self.hash, view=view
+            )
+        except SlackApiError as e:
+            # The user closed the modal or moved on while we worked; nothing to update
+            if slack_error(e) in ("not_found", "hash_conflict"):
+                self.closed = True
+                return
+            raise
+        self.hash = res.get("view", {}).get("hash")
+
+    async def message(self, text: str, title: str = "Slack Extra"):
+        """Replace the placeholder with a plain message, e.g. for errors."""
+        await self.update(
+            (Modal().title(title).add_block(Section(text=text)).close("Close")).build()
+        )
+
+
+async def open_loading_modal(
+    client: AsyncWebClient, trigger_id: str, title: str, push: bool = False
+) -> LoadingModal:
+    """
+    Spend a trigger_id on a loading modal straight away, before it expires (3 seconds), so
+    slow checks can run afterwards and finish with `LoadingModal.update`. With `push` the
+    modal is pushed onto an open one instead of opened.
+    """
+    view = (
+        Modal()
+        .title(title)
+        .add_block(Section(text=":hourglass_flowing_sand: Loading..."))
+        .close("Cancel")
+    ).build()
+    if push:
+        res = await client.views_push(trigger_id=trigger_id, view=view)
+    else:
+        res = await client.views_open(trigger_id=trigger_id, view=view)
+    return LoadingModal(client, res["view"])
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import Counter
+from time import monotonic
+
+from slack_extra.config import config
+from slack_extra.utils.metrics import Counter as CounterMetric
+from slack_extra.utils.metrics import Gauge
+from slack_extra.utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_SECONDS = Histogram(
+    "slack_extra_event_loop_lag_seconds",
+    "How late the event loop woke up from the monitor's sleep",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+LOOP_STALLS = CounterMetric(
+    "slack_extra_event_loop_stalls_total",
+    "Times the event loop was blocked for longer than the monitor threshold",
+)
+TASKS = Gauge(
+    "slack_extra_asyncio_tasks",
+    "Pending asyncio tasks by coroutine name",
+    ("coro",),
+)
+
+
+def _coro_name(task: asyncio.Task) -> str:
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or type(coro).__name__
+
+
+class LoopMonitor:
+    """
+    Samples event loop lag from a background task, and watches for stalls from a separate
+    thread so it can log what the loop thread was running while it was blocked.
+    """
+
+    def __init__(self):
+        self.interval = config.monitor.lag_interval
+        self.threshold = config.monitor.lag_threshold
+        self._last_beat = monotonic()
+        self._reported = False
+        self.last_lag = 0.0
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop_thread_id: int | None = None
+
+    def start(self):
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._sample(), name="loop-monitor")
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._thread:
+            self._thread.join(timeout=self.interval * 2)
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.last_lag = lag
+            LOOP_LAG_SECONDS.observe(lag)
+            if lag > self.threshold:
+                LOOP_STALLS.inc()
+                if not self._reported:
+                    logger.warning(f"Event loop was blocked for {lag:.3f}s")
+            self._last_beat = monotonic()
+            self._reported = False
+
+    def _watch(self):
+        # Runs in its own thread: if the sampler hasn't checked in for a while the loop is
+        # stuck, and the loop thread's current frame is whatever is blocking it
+        while not self._stop.wait(self.interval / 2):
+            stalled = monotonic() - self._last_beat - self.interval
+            if stalled <= self.threshold or self._reported:
+                continue
+            self._reported = True
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "unavailable"
+            logger.warning(
+                f"Event loop has been blocked for {stalled:.3f}s, loop thread stack:\n{stack}"
+            )
+
+
+def take_task_census() -> Counter[str]:
+    """Count pending tasks on the running loop by coroutine name and export them as gauges."""
+    census = Counter(_coro_name(task) for task in asyncio.all_tasks())
+    TASKS.clear()
+    for name, count in census.items():
+        TASKS.set(count, coro=name)
+    return census
+
+
+loop_monitor = LoopMonitor()
@@ -0,0 +1,64 @@
+import asyncio
+import inspect
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+
+Step = Callable[..., Awaitable[Any]]
+
+
+class Pipeline:
+    """
+    A small dependency graph of async steps.
+
+    A step's dependencies are the names of its parameters: each step starts as soon as the steps
+    it names have finished, and is called with their results. Steps must be added after the steps
+    they depend on, which also keeps the graph acyclic.
+
+        pipeline = Pipeline()
+
+        @pipeline.step
+        async def user():
+            return await client.users_info(user=user_id)
+
+        @pipeline.step
+        async def message(user):
+            return await client.chat_postMessage(...)
+
+        results = await pipeline.run()
+
+    If any step raises, every other step is cancelled and the exception is re-raised from `run`.
+    """
+
+    def __init__(self):
+        self._steps: dict[str, tuple[Step, list[str]]] = {}
+
+    def step(self, func: Step) -> Step:
+        name = func.__name__
+        deps = list(inspect.signature(func).parameters)
+        missing = [dep for dep in deps if dep not in self._steps]
+        if missing:
+            raise ValueError(f"Step '{name}' depends on unknown steps: {missing}")
+        if name in self._steps:
+            raise ValueError(f"Step '{name}' is already defined")
+        self._steps[name] = (func, deps)
+        return func
+
+    async def run(self) -> dict[str, Any]:
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_step(func: Step, deps: list[str]):
+            kwargs = {dep: await tasks[dep] for dep in deps}
+            return await func(**kwargs)
+
+        for name, (func, deps) in self._steps.items():
+            tasks[name] = asyncio.create_task(run_step(func, deps), name=name)
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return {name: task.result() for name, task in tasks.items()}
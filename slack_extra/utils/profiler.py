@@ -0,0 +1,62 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+from time import monotonic
+from time import sleep
+from types import FrameType
+
+_lock = asyncio.Lock()
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _collapse(frame: FrameType | None) -> list[str]:
+    stack = []
+    while frame is not None:
+        stack.append(_frame_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def sample_stacks(seconds: float, interval: float) -> Counter[str]:
+    """
+    Sample every thread's stack each `interval` seconds for `seconds`, returning counts of
+    semicolon-joined stacks (root first) prefixed with the thread name.
+    """
+    me = threading.get_ident()
+    stacks: Counter[str] = Counter()
+    deadline = monotonic() + seconds
+    while monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == me:
+                continue
+            stack = _collapse(frame)
+            if stack:
+                thread = names.get(thread_id, str(thread_id))
+                stacks[";".join([thread, *stack])] += 1
+        sleep(interval)
+    return stacks
+
+
+def render_collapsed(stacks: Counter[str]) -> str:
+    """Render samples in the collapsed format read by flamegraph.pl and speedscope."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+async def profile(seconds: float, interval: float) -> str:
+    """Run the sampler on a separate thread so it can see the event loop while it works."""
+    if _lock.locked():
+        raise ProfilerBusy()
+    async with _lock:
+        stacks = await asyncio.to_thread(sample_stacks, seconds, interval)
+    return render_collapsed(stacks)
@@ -0,0 +1,136 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from slack_sdk.errors import SlackApiError
+
+
+class RateLimiter:
+    """Token bucket for keeping background work under a Slack rate limit tier."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        # `rate` is in calls per second
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def call(self, method, **kwargs):
+        """Call a Slack API method once a token is available, waiting out any 429s."""
+        while True:
+            await self.acquire()
+            try:
+                return await method(**kwargs)
+            except SlackApiError as e:
+                if e.response.status_code != 429:
+                    raise
+                headers = e.response.headers or {}
+                retry_after = headers.get("Retry-After") or headers.get("retry-after")
+                await asyncio.sleep(int(retry_after or 5))
+
+
+class PriorityLimiter:
+    """
+    Caps concurrent calls, handing freed slots to the most important waiting lane first.
+    `reserved` slots can only be used by the first lane, so it never queues behind the rest.
+    A caller that has waited `max_wait` seconds is served ahead of more important lanes, so
+    busy lanes can delay the others but never starve them.
+    """
+
+    def __init__(
+        self, slots: int, reserved: int, lanes: tuple[str, ...], max_wait: float
+    ):
+        if not 0 <= reserved < slots:
+            raise ValueError(
+                f"reserved ({reserved}) must leave at least one of {slots} slots for all lanes"
+            )
+        self.slots = slots
+        self.reserved = reserved
+        self.lanes = lanes
+        self.max_wait = max_wait
+        self._in_use = 0
+        # Per lane, in priority order: (queued at, future) of callers waiting for a slot
+        self._waiters: list[deque[tuple[float, asyncio.Future]]] = [
+            deque() for _ in lanes
+        ]
+
+    def _limit(self, priority: int) -> int:
+        return self.slots if priority == 0 else self.slots - self.reserved
+
+    def _prune(self):
+        # Callers cancelled while waiting may not have removed themselves yet
+        for waiters in self._waiters:
+            while waiters and waiters[0][1].done():
+                waiters.popleft()
+
+    def _next(self, now: float) -> int | None:
+        """The lane whose head waiter is served next: the longest overdue, else the first."""
+        self._prune()
+        heads = []
+        for priority, waiters in enumerate(self._waiters):
+            if waiters:
+                heads.append((priority, waiters[0][0]))
+        if not heads:
+            return None
+        overdue = [head for head in heads if now - head[1] >= self.max_wait]
+        if overdue:
+            return min(overdue, key=lambda head: head[1])[0]
+        return heads[0][0]
+
+    def _wake(self):
+        now = monotonic()
+        while (priority := self._next(now)) is not None:
+            if self._in_use >= self._limit(priority):
+                # An overdue waiter can't use the reserved slots, but the first lane can
+                if priority == 0 or not self._waiters[0] or self._in_use >= self.slots:
+                    break
+                priority = 0
+            _, future = self._waiters[priority].popleft()
+            self._in_use += 1
+            future.set_result(None)
+
+    def _release(self):
+        self._in_use -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, lane: str):
+        priority = self.lanes.index(lane)
+        self._prune()
+        # Waiters in other lanes only exist while their lanes' limit is used up, so just the
+        # queues at least as important as ours can be ahead of us
+        waiting = any(self._waiters[i] for i in range(priority + 1))
+        if not waiting and self._in_use < self._limit(priority):
+            self._in_use += 1
+        else:
+            waiter = (monotonic(), asyncio.get_running_loop().create_future())
+            self._waiters[priority].append(waiter)
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                if waiter[1].cancelled():
+                    if waiter in self._waiters[priority]:
+                        self._waiters[priority].remove(waiter)
+                else:
+                    # A slot handed over just as we were cancelled goes to the next waiter
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
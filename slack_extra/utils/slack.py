@@ -1,4 +1,7 @@
+import asyncio
+
 from slack_extra.config import config
+from slack_extra.utils.channels import get_channel_info
 from slack_extra.utils.logging import send_heartbeat
 
 
@@ -33,35 +36,48 @@ async def remove_channel_manager(user_id: str, channel_id: str) -> tuple[bool, d
             return False, res
 
 
-async def add_channel_manager(user_id: str, channel_id: str) -> tuple[bool, dict]:
+async def add_channel_managers(user_ids: list[str], channel_id: str) -> dict:
+    """
+    Make several users channel managers with a single admin.roles.addMembers call, waiting out
+    rate limits. Doesn't send a heartbeat, so bulk callers can report once.
+    """
     from slack_extra.env import env
 
     data = {
         "token": config.slack.xoxc_token,
         "role_id": "Rl0A",
         "role_scopes": channel_id,
-        "user_ids": user_id,
+        "user_ids": ",".join(user_ids),
     }
     headers = {"Cookie": f"d={config.slack.xoxd_token}"}
 
-    async with env.http.post(
-        "https://slack.com/api/admin.roles.addMembers?_x_gantry=false",
-        data=data,
-        headers=headers,
-    ) as resp:
-        res = await resp.json()
-        if res.get("ok"):
-            await send_heartbeat(
-                f"<@{user_id}> is now a channel manager in <#{channel_id}>",
-                messages=[f"```{res}```"],
-            )
-            return True, res
-        else:
-            await send_heartbeat(
-                f":warning: Failed to add <@{user_id}> as a channel manager in <#{channel_id}>",
-                messages=[f"```{res}```"],
-            )
-            return False, res
+    while True:
+        async with env.http.post(
+            "https://slack.com/api/admin.roles.addMembers?_x_gantry=false",
+            data=data,
+            headers=headers,
+        ) as resp:
+            res = await resp.json()
+            if res.get("error") != "ratelimited":
+                return res
+            retry_after = int(resp.headers.get("Retry-After", 5))
+        await asyncio.sleep(retry_after)
+
+
+async def add_channel_manager(user_id: str, channel_id: str) -> tuple[bool, dict]:
+    res = await add_channel_managers([user_id], channel_id)
+    if res.get("ok"):
+        await send_heartbeat(
+            f"<@{user_id}> is now a channel manager in <#{channel_id}>",
+            messages=[f"```{res}```"],
+        )
+        return True, res
+    else:
+        await send_heartbeat(
+            f":warning: Failed to add <@{user_id}> as a channel manager in <#{channel_id}>",
+            messages=[f"```{res}```"],
+        )
+        return False, res
 
 
 async def get_channel_managers(channel_id: str) -> list[str]:
@@ -100,8 +116,6 @@ async def get_channel_managers(channel_id: str) -> list[str]:
 
 
 async def is_channel_manager(user_id: str, channel_id: str):
-    from slack_extra.env import env
-
     if await is_admin(user_id):
         return True
 
@@ -109,9 +123,8 @@ async def is_channel_manager(user_id: str, channel_id: str):
     if channel_managers:
         return user_id in channel_managers
 
-    channel_info = await env.slack_client.conversations_info(channel=channel_id)
-    creator = channel_info.get("channel", {}).get("creator")
-    return user_id == creator
+    channel_info = await get_channel_info(channel_id)
+    return user_id == channel_info.get("creator")
 
 
 async def is_admin(user_id: str):
@@ -0,0 +1,127 @@
+import json
+import logging
+import zlib
+from datetime import datetime
+from datetime import timezone
+
+from slack_extra.config import config
+from slack_extra.tables import SpoilerClick
+from slack_extra.utils.cache import LRUCache
+from slack_extra.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+CLICKS_DROPPED = Counter(
+    "slack_extra_spoiler_clicks_dropped_total",
+    "Spoiler reveal clicks not recorded because the click buffer was full",
+)
+
+# Ready-to-send reveal modals keyed by (channel, message_ts), so bursts of clicks on a popular
+# spoiler skip the DB and JSON decoding
+spoiler_modals: LRUCache[tuple[str, str], dict] = LRUCache(
+    config.spoilers.modal_cache_size
+)
+
+
+def build_spoiler_modal(block: dict, user: str) -> dict:
+    return {
+        "type": "modal",
+        "title": {"type": "plain_text", "text": "Spoiler 👀"},
+        "close": {"type": "plain_text", "text": "Close"},
+        "blocks": [
+            block,
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"spoilered by <@{user}>",
+                    }
+                ],
+            },
+        ],
+    }
+
+
+def cache_spoiler_modal(channel: str, ts: str, block: dict, user: str) -> dict:
+    modal = build_spoiler_modal(block, user)
+    spoiler_modals.set((channel, ts), modal)
+    return modal
+
+
+def pack_spoiler_message(message: str) -> bytes:
+    """Compress a stored spoiler block for the archive table."""
+    return zlib.compress(message.encode())
+
+
+def unpack_spoiler_message(data: bytes) -> dict:
+    return json.loads(zlib.decompress(data))
+
+
+_UPSERT_CLICKS = """
+INSERT INTO spoiler_click (channel, message_ts, "user", clicks, first_clicked_at, last_clicked_at)
+SELECT * FROM unnest({}::varchar[], {}::varchar[], {}::varchar[], {}::integer[], {}::timestamptz[], {}::timestamptz[])
+ON CONFLICT (channel, message_ts, "user") DO UPDATE SET
+    clicks = spoiler_click.clicks + EXCLUDED.clicks,
+    last_clicked_at = GREATEST(spoiler_click.last_clicked_at, EXCLUDED.last_clicked_at)
+"""
+
+
+class ClickCounter:
+    """Buffers spoiler reveal clicks in memory so they can be written to Postgres in batches."""
+
+    def __init__(self, max_pending: int):
+        # (channel, message_ts, user) -> [clicks, first_clicked_at, last_clicked_at]
+        self._pending: dict[tuple[str, str, str], list] = {}
+        # Caps memory while flushes keep failing, e.g. during a database outage
+        self.max_pending = max_pending
+
+    def record(self, channel: str, ts: str, user: str):
+        now = datetime.now(timezone.utc)
+        entry = self._pending.get((channel, ts, user))
+        if entry:
+            entry[0] += 1
+            entry[2] = now
+        elif len(self._pending) < self.max_pending:
+            self._pending[(channel, ts, user)] = [1, now, now]
+        else:
+            CLICKS_DROPPED.inc()
+
+    async def flush(self) -> int:
+        """Write pending clicks in a single upsert, returning how many rows were touched."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        try:
+            await SpoilerClick.raw(
+                _UPSERT_CLICKS,
+                [key[0] for key in keys],
+                [key[1] for key in keys],
+                [key[2] for key in keys],
+                [pending[key][0] for key in keys],
+                [pending[key][1] for key in keys],
+                [pending[key][2] for key in keys],
+            )
+        except Exception:
+            # Keep the clicks around for the next flush, as far as the buffer has room
+            dropped = 0
+            for key, (clicks, first, last) in pending.items():
+                entry = self._pending.get(key)
+                if entry:
+                    entry[0] += clicks
+                    entry[1] = first
+                elif len(self._pending) < self.max_pending:
+                    self._pending[key] = [clicks, first, last]
+                else:
+                    dropped += clicks
+            CLICKS_DROPPED.inc(dropped)
+            logger.warning(
+                f"Failed to flush {len(keys)} spoiler click rows; "
+                f"{len(self._pending)} buffered, {dropped} clicks dropped"
+            )
+            raise
+        return len(keys)
+
+
+spoiler_clicks = ClickCounter(config.spoilers.click_buffer_size)
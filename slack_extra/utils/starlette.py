@@ -1,39 +1,96 @@
+import hmac
 import logging
 
 from slack_bolt.adapter.starlette.async_handler import AsyncSlackRequestHandler
 from slack_sdk.errors import SlackApiError
+from slack_sdk.signature import SignatureVerifier
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import HTMLResponse
 from starlette.responses import JSONResponse
+from starlette.responses import PlainTextResponse
 from starlette.routing import Route
 
 from slack_extra.config import config
 from slack_extra.datastore import PiccoloInstallationStore
 from slack_extra.datastore import PiccoloOAuthStateStore
 from slack_extra.env import env
+from slack_extra.utils.fastpath import EVENTS_DROPPED
+from slack_extra.utils.fastpath import should_drop
+from slack_extra.utils.health import health_checker
+from slack_extra.utils.metrics import render_metrics
+from slack_extra.utils.profiler import profile
+from slack_extra.utils.profiler import ProfilerBusy
 
 logger = logging.getLogger(__name__)
 
 req_handler = AsyncSlackRequestHandler(env.app)
+verifier = SignatureVerifier(config.slack.signing_secret)
 
 
 async def endpoint(req: Request):
+    # Nearly all message events are no-ops; answer those without Bolt parsing the request,
+    # running middleware and matching listeners. Starlette caches the body for Bolt.
+    body = await req.body()
+    if should_drop(body) and verifier.is_valid_request(body, dict(req.headers)):
+        EVENTS_DROPPED.inc()
+        return PlainTextResponse("")
     return await req_handler.handle(req)
 
 
 async def health(req: Request):
-    try:
-        await env.slack_client.api_test()
-        slack_healthy = True
-    except Exception:
-        slack_healthy = False
+    report = health_checker.report()
+    slack = report["dependencies"].get("slack", {})
+    return JSONResponse(
+        {"healthy": report["ready"], "slack": slack.get("healthy", False), **report}
+    )
+
 
+async def health_live(req: Request):
+    # Serving this at all means the loop is responsive; a stale prober means it's starved
+    stale = health_checker.stale
     return JSONResponse(
-        {
-            "healthy": slack_healthy,
-            "slack": slack_healthy,
-        }
+        {"alive": not stale, "loop_lag_ms": health_checker.report()["loop_lag_ms"]},
+        status_code=503 if stale else 200,
+    )
+
+
+async def health_ready(req: Request):
+    report = health_checker.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+async def metrics(req: Request):
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+async def debug_profile(req: Request):
+    token = config.debug.admin_token
+    if not token:
+        return PlainTextResponse("Not Found", status_code=404)
+    if not hmac.compare_digest(req.headers.get("authorization", ""), f"Bearer {token}"):
+        return PlainTextResponse("Unauthorized", status_code=401)
+
+    try:
+        seconds = float(req.query_params.get("seconds", 10))
+        interval = float(req.query_params.get("interval", 0.01))
+    except ValueError:
+        return PlainTextResponse("Invalid seconds or interval", status_code=400)
+    if (
+        not 0 < seconds <= config.debug.profile_max_seconds
+        or not 0.001 <= interval <= 1
+    ):
+        return PlainTextResponse("Invalid seconds or interval", status_code=400)
+
+    try:
+        collapsed = await profile(seconds, interval)
+    except ProfilerBusy:
+        return PlainTextResponse("A profile is already running", status_code=409)
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'},
     )
 
 
@@ -151,6 +208,10 @@ app = Starlette(
         Route(path="/slack/events", endpoint=endpoint, methods=["POST"]),
         Route(path="/slack/oauth_redirect", endpoint=oauth_redirect, methods=["GET"]),
         Route(path="/health", endpoint=health, methods=["GET"]),
+        Route(path="/health/live", endpoint=health_live, methods=["GET"]),
+        Route(path="/health/ready", endpoint=health_ready, methods=["GET"]),
+        Route(path="/metrics", endpoint=metrics, methods=["GET"]),
+        Route(path="/debug/profile", endpoint=debug_profile, methods=["GET"]),
     ],
     lifespan=env.enter,
 )
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Literal
+
+from slack_extra.config import config
+from slack_extra.utils.cache import TTLCache
+from slack_extra.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+USERGROUP_UPDATES = Counter(
+    "slack_extra_usergroup_updates_total",
+    "usergroups.users.update calls made for /se group, and the changes they carried",
+    ("kind",),
+)
+
+
+class UsergroupUpdater:
+    """
+    Serializes membership changes per usergroup. Joins and leaves that arrive within
+    `window` seconds of each other are applied to the group's member set together and
+    written with a single `usergroups.users.update`, so concurrent changes can't overwrite
+    each other.
+    """
+
+    def __init__(self, window: float, members_ttl: float):
+        self.window = window
+        self._members: TTLCache[str, set[str]] = TTLCache(maxsize=1000, ttl=members_ttl)
+        # usergroup -> [(action, user, future)]
+        self._pending: dict[str, list[tuple[str, str, asyncio.Future]]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    async def submit(self, usergroup: str, action: Literal["join", "leave"], user: str):
+        """
+        Queue a change and wait for it to be written. Returns False if there was nothing to
+        do (joining a group the user is already in, or leaving one they aren't), and raises
+        `SlackApiError` if Slack rejected the batch.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(usergroup, []).append((action, user, future))
+        if usergroup not in self._workers:
+            self._workers[usergroup] = asyncio.create_task(
+                self._run(usergroup), name=f"usergroup:{usergroup}"
+            )
+        return await future
+
+    async def _run(self, usergroup: str):
+        try:
+            while self._pending.get(usergroup):
+                await asyncio.sleep(self.window)
+                batch = self._pending.pop(usergroup)
+                try:
+                    await self._apply(usergroup, batch)
+                except Exception as e:
+                    self._members.pop(usergroup)
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+        finally:
+            del self._workers[usergroup]
+
+    async def _apply(
+        self, usergroup: str, batch: list[tuple[str, str, asyncio.Future]]
+    ):
+        from slack_extra.env import env
+
+        members = self._members.get(usergroup)
+        if members is None:
+            res = await env.slack_client.usergroups_users_list(usergroup=usergroup)
+            members = set(res.get("users", []))
+
+        updated = set(members)
+        results = []
+        for action, user, future in batch:
+            if action == "join":
+                results.append((future, user not in updated))
+                updated.add(user)
+            else:
+                results.append((future, user in updated))
+                updated.discard(user)
+
+        if updated != members:
+            res = await env.slack_client.usergroups_users_update(
+                usergroup=usergroup, users=sorted(updated)
+            )
+            USERGROUP_UPDATES.inc(kind="call")
+            USERGROUP_UPDATES.inc(len(batch), kind="change")
+            updated = set(res.get("usergroup", {}).get("users") or updated)
+            logger.debug(f"Applied {len(batch)} changes to {usergroup} in one update")
+        self._members.set(usergroup, updated)
+
+        for future, changed in results:
+            if not future.done():
+                future.set_result(changed)
+
+
+usergroup_updater = UsergroupUpdater(
+    window=config.usergroups.batch_window, members_ttl=config.usergroups.members_ttl
+)
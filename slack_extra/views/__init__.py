@@ -1,3 +1,5 @@
+from slack_extra.utils.middleware import instrument
+from slack_extra.views.bulk_manager import bulk_manager_handler
 from slack_extra.views.configure_anchor import configure_anchor_handler
 from slack_extra.views.create_spoiler import create_spoiler_handler
 from slack_extra.views.edit_move import edit_move_handler
@@ -9,9 +11,10 @@ VIEWS = [
     {"id": "create_spoiler", "handler": create_spoiler_handler},
     {"id": "setup_move", "handler": setup_move_handler},
     {"id": "edit_move", "handler": edit_move_handler},
+    {"id": "bulk_manager", "handler": bulk_manager_handler},
 ]
 
 
 def register_views(app):
     for view in VIEWS:
-        app.view(view["id"])(view["handler"])
+        app.view(view["id"])(instrument("view", view["id"])(view["handler"]))
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+
+from blockkit import Input
+from blockkit import Modal
+from blockkit import MultiChannelsSelect
+from blockkit import MultiUsersSelect
+from blockkit import Section
+from slack_bolt.async_app import AsyncAck
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_extra.config import config
+from slack_extra.utils.channels import get_channel_info
+from slack_extra.utils.client import slack_error
+from slack_extra.utils.lanes import use_lane
+from slack_extra.utils.logging import send_heartbeat
+from slack_extra.utils.members import get_members
+from slack_extra.utils.members import is_synced
+from slack_extra.utils.ratelimit import RateLimiter
+from slack_extra.utils.slack import add_channel_managers
+from slack_extra.utils.slack import get_channel_managers
+from slack_extra.utils.slack import is_admin
+
+logger = logging.getLogger(__name__)
+
+# admin.roles.addMembers is Tier 2 (~20/min)
+limiter = RateLimiter(
+    rate=config.managers.bulk_rate, burst=config.managers.bulk_concurrency
+)
+
+
+def bulk_manager_view() -> dict:
+    return (
+        Modal()
+        .callback_id("bulk_manager")
+        .title("Bulk Channel Managers")
+        .add_block(
+            Section(
+                text="Make everyone you pick a channel manager of every channel you pick. You need to be a channel manager of the channels yourself."
+            )
+        )
+        .add_block(
+            Input()
+            .label("Channels")
+            .element(MultiChannelsSelect().action_id("channels"))
+            .block_id("channels")
+        )
+        .add_block(
+            Input()
+            .label("New managers")
+            .element(MultiUsersSelect().action_id("users"))
+            .block_id("users")
+        )
+        .submit("Add managers")
+        .close("Cancel")
+    ).build()
+
+
+async def _assign(
+    performer: str,
+    admin: bool,
+    users: list[str],
+    channel: str,
+    slots: asyncio.Semaphore,
+) -> str:
+    async with slots:
+        managers = await get_channel_managers(channel)
+        if not admin:
+            # Same rule as is_channel_manager, reusing the manager list we need anyway
+            if managers:
+                allowed = performer in managers
+            else:
+                try:
+                    allowed = performer == (await get_channel_info(channel)).get(
+                        "creator"
+                    )
+                except SlackApiError as e:
+                    return f":x: <#{channel}>: couldn't look up the channel (`{slack_error(e)}`)"
+            if not allowed:
+                return f":no_entry: <#{channel}>: you're not a channel manager here"
+
+        wanted = [user for user in users if user not in managers]
+        not_in = []
+        if await is_synced(channel):
+            members = await get_members(channel)
+            not_in = [user for user in wanted if user not in members]
+            wanted = [user for user in wanted if user in members]
+
+        added = []
+        error = None
+        size = config.managers.bulk_batch_size
+        for start in range(0, len(wanted), size):
+            batch = wanted[start : start + size]
+            await limiter.acquire()
+            try:
+                res = await add_channel_managers(batch, channel)
+            except Exception as e:
+                # Non-JSON responses and network errors; keep what was already added
+                logger.exception(f"Bulk manager assignment failed in {channel}")
+                error = type(e).__name__
+                break
+            if not res.get("ok"):
+                error = res.get("error", "unknown_error")
+                break
+            added += batch
+
+    line = f"<#{channel}>: {len(added)} added"
+    if len(users) - len(wanted) - len(not_in):
+        line += f", {len(users) - len(wanted) - len(not_in)} already managers"
+    if not_in:
+        line += f", not in the channel: {', '.join(f'<@{u}>' for u in not_in)}"
+    if error:
+        return f":warning: {line}, stopped with `{error}`"
+    return f":white_check_mark: {line}"
+
+
+def _sections(lines: list[str]) -> list[Section]:
+    # Section text is capped at 3000 characters
+    sections = []
+    chunk = ""
+    for line in lines:
+        if chunk and len(chunk) + len(line) + 1 > 2900:
+            sections.append(Section(text=chunk))
+            chunk = ""
+        chunk = f"{chunk}\n{line}" if chunk else line
+    if chunk:
+        sections.append(Section(text=chunk))
+    return sections
+
+
+async def bulk_manager_handler(ack: AsyncAck, body: dict, client: AsyncWebClient):
+    performer = body["user"]["id"]
+    values = body["view"]["state"]["values"]
+    channels = values["channels"]["channels"]["selected_channels"]
+    users = values["users"]["users"]["selected_users"]
+
+    # Assigning across many channels takes far longer than the 3 seconds we have to ack
+    await ack(
+        response_action="update",
+        view=(
+            Modal()
+            .title("Bulk Channel Managers")
+            .add_block(
+                Section(
+                    text=f"Adding {len(users)} managers to {len(channels)} channels... this can take a minute :hourglass_flowing_sand:"
+                )
+            )
+            .close("Close")
+        ).build(),
+    )
+
+    admin = await is_admin(performer)
+    slots = asyncio.Semaphore(config.managers.bulk_concurrency)
+    with use_lane("bulk"):
+        results = await asyncio.gather(
+            *(_assign(performer, admin, users, channel, slots) for channel in channels),
+            return_exceptions=True,
+        )
+    # One channel failing mustn't lose the report for the rest
+    lines = []
+    for channel, result in zip(channels, results):
+        if isinstance(result, Exception):
+            logger.error(
+                f"Bulk manager assignment failed in {channel}", exc_info=result
+            )
+            result = (
+                f":x: <#{channel}>: something went wrong (`{type(result).__name__}`)"
+            )
+        lines.append(result)
+
+    summary = f"<@{performer}> ran a bulk manager assignment of {', '.join(f'<@{u}>' for u in users)}"
+    await send_heartbeat(summary, messages=["\n".join(lines)])
+
+    view = Modal().title("Bulk Channel Managers").close("Done")
+    for section in _sections(lines)[:100]:
+        view = view.add_block(section)
+    try:
+        await client.views_update(view_id=body["view"]["id"], view=view.build())
+    except SlackApiError:
+        # The modal was closed while we worked; send the result instead
+        await client.chat_postMessage(channel=performer, text="\n".join(lines))
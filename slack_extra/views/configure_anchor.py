@@ -4,6 +4,7 @@ from slack_sdk.web.async_client import AsyncWebClient
 from slack_extra.config import config
 from slack_extra.datastore import PiccoloInstallationStore
 from slack_extra.tables import AnchorConfig
+from slack_extra.utils.anchors import set_anchored
 
 
 async def configure_anchor_handler(ack: AsyncAck, body: dict, client: AsyncWebClient):
@@ -57,6 +58,7 @@ async def configure_anchor_handler(ack: AsyncAck, body: dict, client: AsyncWebCl
                 user_id=user_id,
             )
             await AnchorConfig.insert(anchor_config)
+            set_anchored(channel, True)
             return
         case "edit":
             anchor_config = (
@@ -73,6 +75,7 @@ async def configure_anchor_handler(ack: AsyncAck, body: dict, client: AsyncWebCl
                         AnchorConfig.enabled: True,
                     }
                 ).where(AnchorConfig.channel_id == channel)
+                set_anchored(channel, True)
                 return
             else:
                 await client.chat_postMessage(
@@ -1,11 +1,156 @@
-from collections import defaultdict
-from copy import deepcopy
+import json
+from copy import copy
 
 from slack_bolt.async_app import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
 
-from slack_extra.config import config
 from slack_extra.tables import Spoiler
+from slack_extra.utils.executor import run_cpu_bound
+from slack_extra.utils.files import FileRelayError
+from slack_extra.utils.files import relay_files
+from slack_extra.utils.pipeline import Pipeline
+from slack_extra.utils.spoilers import cache_spoiler_modal
+
+SPOILER_MARKER = "||"
+# Stand-in for non-text inline elements in the joined text. Anything other than '|' works, since it
+# only has to stop a marker from being matched across an emoji/mention.
+_NONTEXT_PLACEHOLDER = "\x00"
+
+
+def _redaction_element():
+    return {"type": "text", "text": "[spoiler hidden]", "style": {"code": True}}
+
+
+def _restyle_text_element(el, text, bold):
+    """
+    Copy a text inline element with new text and no 'spoiler' key. Spoilered slices are forced bold,
+    everything else has any bold style removed.
+    """
+    new = dict(el)
+    new["text"] = text
+    new.pop("spoiler", None)
+    if bold:
+        style = dict(new.get("style", {}))
+        style["bold"] = True
+        new["style"] = style
+    elif "style" in new:
+        new["style"] = {k: v for k, v in new["style"].items() if k != "bold"}
+    return new
+
+
+def _split_spoilers_with_sources(inline_elements):
+    """
+    Same as `_split_spoilers_in_inline_elements`, but also returns the index of the input element
+    every output element came from: (bold, redacted, bold_sources, redacted_sources).
+    """
+    # Join all text into a single string so '||' markers can be found with str.find, including
+    # markers that straddle two elements. Non-text items (emoji, user mentions, etc.) take up one
+    # placeholder character so they can fall inside a spoiler but never form part of a marker.
+    parts = []
+    bounds = []  # (src_idx, start, end, is_text) for each element that takes up space
+    pos = 0
+    for idx, el in enumerate(inline_elements):
+        if not isinstance(el, dict):
+            continue
+        text = el.get("text")
+        if isinstance(text, str):
+            if not text:
+                continue
+            parts.append(text)
+            bounds.append((idx, pos, pos + len(text), True))
+            pos += len(text)
+        else:
+            parts.append(_NONTEXT_PLACEHOLDER)
+            bounds.append((idx, pos, pos + 1, False))
+            pos += 1
+
+    if not parts:
+        # Nothing to do; return copies of the original inline elements for both variants
+        sources = list(range(len(inline_elements)))
+        return (
+            [copy(el) for el in inline_elements],
+            [copy(el) for el in inline_elements],
+            sources,
+            list(sources),
+        )
+    joined = "".join(parts)
+
+    # Visible spans between markers. Consecutive spans with the same spoiler state share a segment
+    # id, so that e.g. '||a||||b||' collapses to a single redaction in the redacted variant.
+    spans = []  # (start, end, in_spoiler, seg_id)
+    in_spoiler = False
+    seg_id = -1
+    seg_state = None
+    start = 0
+    while True:
+        marker = joined.find(SPOILER_MARKER, start)
+        end = len(joined) if marker == -1 else marker
+        if end > start:
+            if in_spoiler != seg_state:
+                seg_id += 1
+                seg_state = in_spoiler
+            spans.append((start, end, in_spoiler, seg_id))
+        if marker == -1:
+            break
+        in_spoiler = not in_spoiler
+        start = marker + len(SPOILER_MARKER)
+
+    # Cut the spans at element boundaries. Text from the same element and segment is merged back
+    # into one slice (its pieces are only split by markers); non-text items are always their own.
+    slices = []  # [src_idx, in_spoiler, seg_id, text pieces or None for non-text]
+    b = 0
+    for start, end, in_spoiler, seg_id in spans:
+        while bounds[b][2] <= start:
+            b += 1
+        j = b
+        while j < len(bounds) and bounds[j][1] < end:
+            idx, el_start, el_end, is_text = bounds[j]
+            if not is_text:
+                slices.append([idx, in_spoiler, seg_id, None])
+            else:
+                piece = joined[max(start, el_start) : min(end, el_end)]
+                last = slices[-1] if slices else None
+                if (
+                    last is not None
+                    and last[0] == idx
+                    and last[2] == seg_id
+                    and last[3] is not None
+                ):
+                    last[3].append(piece)
+                else:
+                    slices.append([idx, in_spoiler, seg_id, [piece]])
+            j += 1
+
+    bold_out = []
+    redacted_out = []
+    bold_sources = []
+    redacted_sources = []
+    redacted_seg_ids = set()
+    for idx, in_spoiler, seg_id, pieces in slices:
+        el = inline_elements[idx]
+        text = "".join(pieces) if pieces is not None else None
+        if text is None:
+            # Non-text items are kept as-is in the bold variant (minus any spoiler flag)
+            new_b = dict(el)
+            new_b.pop("spoiler", None)
+        else:
+            new_b = _restyle_text_element(el, text, bold=in_spoiler)
+        bold_out.append(new_b)
+        bold_sources.append(idx)
+
+        if in_spoiler:
+            # One redaction per spoiler segment, however many elements it covers
+            if seg_id not in redacted_seg_ids:
+                redacted_seg_ids.add(seg_id)
+                redacted_out.append(_redaction_element())
+                redacted_sources.append(idx)
+        else:
+            if text is None:
+                redacted_out.append(dict(el))
+            else:
+                redacted_out.append(_restyle_text_element(el, text, bold=False))
+            redacted_sources.append(idx)
+    return bold_out, redacted_out, bold_sources, redacted_sources
 
 
 def _split_spoilers_in_inline_elements(inline_elements):
@@ -20,231 +165,11 @@ def _split_spoilers_in_inline_elements(inline_elements):
       using {'style': {'code': True}}). Emojis and other non-text inline elements that fall within
       spoiler ranges will be considered part of the spoiler and thus replaced by the redaction.
 
-    Each returned element may include an internal transient '_src_idx' integer indicating the index of the
-    original input element it originated from. This is used by higher-level callers to remap combined
-    inline lists back into sectioned structures. Callers should strip these before returning results to
-    external consumers.
+    Markers are found by scanning the joined text of all elements, so a spoiler (or a marker) may
+    span element boundaries. The work is linear in the length of the text: elements are copied
+    shallowly and only the ones that change are rebuilt.
     """
-    # Build flattened char/element list for all inline elements. For text elements we create one
-    # entry per character; for non-text inline elements (emoji, user tokens, etc.) we create a
-    # single placeholder entry so they can be included in spoiler segments.
-    char_list = []  # entries: {'type': 'char'|'elem', 'char'?, 'src_idx', 'is_marker', 'in_spoiler', 'el'?}
-    for i, el in enumerate(inline_elements):
-        text = el.get("text") if isinstance(el, dict) else None
-        if isinstance(text, str):
-            for j, ch in enumerate(text):
-                char_list.append(
-                    {
-                        "type": "char",
-                        "char": ch,
-                        "src_idx": i,
-                        "offset": j,
-                        "is_marker": False,
-                        "in_spoiler": False,
-                    }
-                )
-        elif isinstance(el, dict):
-            # Non-text inline element (emoji, user mention, etc.). Represent as a single entry so
-            # it can be included in spoiler runs and thus hidden in the redacted variant.
-            char_list.append(
-                {
-                    "type": "elem",
-                    "char": None,
-                    "src_idx": i,
-                    "is_nontext": True,
-                    "el": deepcopy(el),
-                    "is_marker": False,
-                    "in_spoiler": False,
-                }
-            )
-
-    if not char_list:
-        # Nothing to do; return shallow copies of original inline elements for both variants
-        b = [deepcopy(el) for el in inline_elements]
-        r = [deepcopy(el) for el in inline_elements]
-        return b, r
-
-    # Mark '||' markers and compute in_spoiler state. Markers can only be characters equal to '|'.
-    in_spoiler = False
-    i = 0
-    n = len(char_list)
-    while i < n:
-        entry = char_list[i]
-        if (
-            entry["type"] == "char"
-            and entry["char"] == "|"
-            and i + 1 < n
-            and char_list[i + 1]["type"] == "char"
-            and char_list[i + 1]["char"] == "|"
-        ):
-            # mark both pipe chars as markers and toggle
-            char_list[i]["is_marker"] = True
-            char_list[i + 1]["is_marker"] = True
-            in_spoiler = not in_spoiler
-            i += 2
-        else:
-            # For both 'char' and 'elem' entries, propagate current in_spoiler state
-            char_list[i]["in_spoiler"] = in_spoiler
-            i += 1
-
-    # Build segments of contiguous visible chars (and non-text items) with same in_spoiler.
-    # Assign each segment an id so that multi-element spoilers can be collapsed to a single
-    # redaction element in the redacted variant.
-    segments = []  # each: {'in_spoiler': bool, 'chars':[char_entry,...], 'id': int}
-    seg = None
-    seg_id = 0
-    for ch in char_list:
-        if ch.get("is_marker"):
-            continue
-        if seg is None:
-            seg = {"in_spoiler": ch["in_spoiler"], "chars": [ch], "id": seg_id}
-        elif seg["in_spoiler"] == ch["in_spoiler"]:
-            seg["chars"].append(ch)
-        else:
-            segments.append(seg)
-            seg_id += 1
-            seg = {"in_spoiler": ch["in_spoiler"], "chars": [ch], "id": seg_id}
-    if seg:
-        segments.append(seg)
-
-    # Group the segment chars (and non-text items) by their source inline element index to create
-    # slices per original inline element. Non-text items produce slices with 'nontext': True and carry
-    # the original element so they can be handled (and redacted) correctly.
-    slices_by_src = defaultdict(list)  # src_idx -> list of slice dicts
-    for s in segments:
-        cur_src = None
-        cur_chars = []
-        for c in s["chars"]:
-            src = c["src_idx"]
-            if c.get("is_nontext"):
-                # Flush any pending text for previous source
-                if cur_src is not None and cur_chars:
-                    slices_by_src[cur_src].append(
-                        {
-                            "in_spoiler": s["in_spoiler"],
-                            "text": "".join(cur_chars),
-                            "seg_id": s["id"],
-                        }
-                    )
-                    cur_src = None
-                    cur_chars = []
-                # Add a non-text slice for this source
-                slices_by_src[src].append(
-                    {
-                        "in_spoiler": s["in_spoiler"],
-                        "nontext": True,
-                        "el": deepcopy(c["el"]),
-                        "seg_id": s["id"],
-                    }
-                )
-                continue
-            if cur_src is None:
-                cur_src = src
-                cur_chars = [c["char"]]
-            elif src != cur_src:
-                slices_by_src[cur_src].append(
-                    {
-                        "in_spoiler": s["in_spoiler"],
-                        "text": "".join(cur_chars),
-                        "seg_id": s["id"],
-                    }
-                )
-                cur_src = src
-                cur_chars = [c["char"]]
-            else:
-                cur_chars.append(c["char"])
-        if cur_src is not None and cur_chars:
-            slices_by_src[cur_src].append(
-                {
-                    "in_spoiler": s["in_spoiler"],
-                    "text": "".join(cur_chars),
-                    "seg_id": s["id"],
-                }
-            )
-
-    # Rebuild inline elements list: for each original inline element, replace text elements with their slices.
-    # Non-text slices are emitted for bold variant but collapsed into the redaction element in the redacted
-    # variant when they are inside a spoiler segment.
-    bold_out = []
-    redacted_out = []
-    emitted_seg_ids = set()
-    for idx, el in enumerate(inline_elements):
-        slices = slices_by_src.get(idx, [])
-        if slices:
-            for sl in slices:
-                if sl.get("nontext"):
-                    # Bold variant: preserve the original non-text element (remove any spoiler flags).
-                    new_b = deepcopy(sl["el"])
-                    new_b.pop("spoiler", None)
-                    # record source index for tracing
-                    new_b["_src_idx"] = idx
-                    bold_out.append(new_b)
-                    # Redacted variant: collapse spoilered non-text into the segment's single code element.
-                    if sl["in_spoiler"]:
-                        segid = sl["seg_id"]
-                        if segid not in emitted_seg_ids:
-                            # Use style.code for inline code and include a source index
-                            code_el = {
-                                "type": "text",
-                                "text": "[spoiler hidden]",
-                                "style": {"code": True},
-                                "_src_idx": idx,
-                            }
-                            redacted_out.append(code_el)
-                            emitted_seg_ids.add(segid)
-                    else:
-                        # Preserve non-spoiler non-text and record source
-                        preserved = deepcopy(sl["el"])
-                        preserved["_src_idx"] = idx
-                        redacted_out.append(preserved)
-                    continue
-                # Text slice handling
-                new_b = deepcopy(el)
-                new_b["text"] = sl["text"]
-                new_b.pop("spoiler", None)
-                if sl["in_spoiler"]:
-                    new_b["style"] = new_b.get("style", {})
-                    new_b["style"]["bold"] = True
-                else:
-                    # ensure no bold carried
-                    if "style" in new_b:
-                        new_b["style"] = {
-                            k: v
-                            for k, v in new_b.get("style", {}).items()
-                            if k != "bold"
-                        }
-                # record source index for tracing
-                new_b["_src_idx"] = idx
-                bold_out.append(new_b)
-
-                # Redacted handling for text slices: emit one code element per spoiler segment id
-                if sl["in_spoiler"]:
-                    segid = sl["seg_id"]
-                    if segid not in emitted_seg_ids:
-                        # Use style.code for inline code and include a source index
-                        code_el = {
-                            "type": "text",
-                            "text": "[spoiler hidden]",
-                            "style": {"code": True},
-                            "_src_idx": idx,
-                        }
-                        redacted_out.append(code_el)
-                        emitted_seg_ids.add(segid)
-                else:
-                    new_r = deepcopy(el)
-                    new_r["text"] = sl["text"]
-                    new_r.pop("spoiler", None)
-                    if "style" in new_r:
-                        new_r["style"] = {
-                            k: v
-                            for k, v in new_r.get("style", {}).items()
-                            if k != "bold"
-                        }
-                    new_r["_src_idx"] = idx
-                    redacted_out.append(new_r)
-        else:
-            # No visible slices for this element (all markers) - skip
-            continue
+    bold_out, redacted_out, _, _ = _split_spoilers_with_sources(inline_elements)
     return bold_out, redacted_out
 
 
@@ -264,8 +189,9 @@ def _is_inline_elements_list(lst):
 def _process_object_variants(obj):
     """
     Recursively walk dict/list structure and apply splitter to inline element lists.
-    Returns a tuple: (bold_variant, redacted_variant), where each is a deep-copied structure
-    of the original but with inline elements transformed as required.
+    Returns a tuple: (bold_variant, redacted_variant), where each is a new structure mirroring
+    the original but with inline elements transformed as required. Unchanged leaf values are
+    shared with the input rather than copied.
     """
     if isinstance(obj, list):
         # If this list looks like inline elements, process it as inline elements
@@ -310,37 +236,21 @@ def _process_object_variants(obj):
                                 combined_to_run_index.append(
                                     run_idx - 1
                                 )  # newline maps to previous run (will be redistributed)
-                            for el in deepcopy(elems):
+                            for el in elems:
                                 merged_inline.append(el)
                                 combined_to_run_index.append(run_idx)
                         # process merged inline elements as a single inline list
-                        b_merged, r_merged = _split_spoilers_in_inline_elements(
-                            merged_inline
+                        b_merged, r_merged, b_sources, r_sources = (
+                            _split_spoilers_with_sources(merged_inline)
                         )
-                        # Distribute merged results back into the original run blocks, preserving each block's type and metadata
+                        # Distribute merged results back into the original run blocks, preserving each block's type and metadata.
+                        # Outputs are already in merged-input order, so each one goes to the run its source element came from.
                         per_run_b = [[] for _ in run]
                         per_run_r = [[] for _ in run]
-
-                        # Group outputs by their _src_idx so we can replay outputs in merged-input order.
-                        def distribute_grouped(output_list, target_per_run):
-                            grouped = defaultdict(list)
-                            orphans = []
-                            for out_el in output_list:
-                                if isinstance(out_el, dict) and "_src_idx" in out_el:
-                                    src = out_el.pop("_src_idx")
-                                    grouped[src].append(out_el)
-                                else:
-                                    orphans.append(out_el)
-                            # Iterate merged positions in order and append grouped outputs for each position
-                            for pos, run_idx in enumerate(combined_to_run_index):
-                                if pos in grouped:
-                                    target_per_run[run_idx].extend(grouped[pos])
-                            # Place orphans at the end of the first run as fallback
-                            if orphans:
-                                target_per_run[0].extend(orphans)
-
-                        distribute_grouped(b_merged, per_run_b)
-                        distribute_grouped(r_merged, per_run_r)
+                        for out_el, src in zip(b_merged, b_sources):
+                            per_run_b[combined_to_run_index[src]].append(out_el)
+                        for out_el, src in zip(r_merged, r_sources):
+                            per_run_r[combined_to_run_index[src]].append(out_el)
 
                         # If any run corresponds to a preformatted block and contains a redaction code element,
                         # collapse the entire run's redacted elements into a single preformatted redaction so code
@@ -355,21 +265,13 @@ def _process_object_variants(obj):
                                     for x in per_run_r[run_idx]
                                 )
                                 if has_code:
-                                    per_run_r[run_idx] = [
-                                        {
-                                            "type": "text",
-                                            "text": "[spoiler hidden]",
-                                            "style": {"code": True},
-                                        }
-                                    ]
+                                    per_run_r[run_idx] = [_redaction_element()]
                         # Now rewrap per-run outputs into blocks matching the original types and metadata
                         for run_idx, sec in enumerate(run):
-                            sec_copy_b = deepcopy(sec)
-                            sec_copy_b["elements"] = per_run_b[run_idx]
-                            bold_list.append(sec_copy_b)
-                            sec_copy_r = deepcopy(sec)
-                            sec_copy_r["elements"] = per_run_r[run_idx]
-                            redacted_list.append(sec_copy_r)
+                            bold_list.append({**sec, "elements": per_run_b[run_idx]})
+                            redacted_list.append(
+                                {**sec, "elements": per_run_r[run_idx]}
+                            )
                     i = j
                 else:
                     b_item, r_item = _process_object_variants(item)
@@ -392,7 +294,7 @@ def _process_object_variants(obj):
                 redacted[k] = r_v
         return bold, redacted
     else:
-        return deepcopy(obj), deepcopy(obj)
+        return obj, obj
 
 
 def split_spoilers_in_rich_text_blocks(blocks):
@@ -406,30 +308,11 @@ def split_spoilers_in_rich_text_blocks(blocks):
       - bold_blocks: spoilered runs forced bold (no 'spoiler' key)
       - redacted_blocks: spoilered runs replaced with an inline code block '[spoiler hidden]' with
         style {'code': True}
-
-    NOTE: internal transient '_src_idx' annotations are stripped from the returned structures.
     """
-    b, r = _process_object_variants(blocks)
-
-    def _strip_src(obj):
-        # Recursively remove any '_src_idx' keys from dicts in the structure.
-        if isinstance(obj, list):
-            return [_strip_src(x) for x in obj]
-        if isinstance(obj, dict):
-            new = {}
-            for k, v in obj.items():
-                if k == "_src_idx":
-                    continue
-                new[k] = _strip_src(v)
-            return new
-        return deepcopy(obj)
-
-    return _strip_src(b), _strip_src(r)
+    return _process_object_variants(blocks)
 
 
 async def create_spoiler_handler(ack: AsyncAck, body: dict, client: AsyncWebClient):
-    from slack_extra.env import env
-
     await ack()
     view = body["view"]
     state = view["state"]["values"]
@@ -438,87 +321,92 @@ async def create_spoiler_handler(ack: AsyncAck, body: dict, client: AsyncWebClie
 
     rich_text = state["spoiler_input"]["spoiler_input"]["rich_text_value"]
     files = state["spoiler_files"]["spoiler_files"]["files"]
-    files_to_upload = []
-    for f in files:
-        async with env.http.get(
-            f["url_private_download"],
-            headers={"Authorization": f"Bearer {config.slack.bot_token}"},
-        ) as resp:
-            if resp.status != 200:
-                await client.chat_postEphemeral(
-                    channel=channel,
-                    user=body["user"]["id"],
-                    text=f"i couldn't download the file {f['name']} :(\nplease try uploading it again!",
-                )
-                return
-            data = await resp.read()
-            files_to_upload.append(
-                {
-                    "file": data,
-                    "filename": f["name"],
-                    "title": f["name"],
-                }
-            )
-
-    bold_blocks, redacted_blocks = split_spoilers_in_rich_text_blocks(rich_text)
+    user_id = body["user"]["id"]
 
-    blocks_to_post = []
-    if isinstance(bold_blocks, dict):
-        blocks_to_post.append(bold_blocks)
-    else:
-        blocks_to_post.extend(bold_blocks)
-    # add a visual separator
-    blocks_to_post.append({"type": "divider"})
-    if isinstance(redacted_blocks, dict):
-        blocks_to_post.append(redacted_blocks)
-    else:
-        blocks_to_post.extend(redacted_blocks)
-
-    message_blocks = [
-        redacted_blocks,
-        {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "View spoiler",
-                        "emoji": True,
-                    },
-                    "action_id": "view_spoiler",
-                    "value": "db",
-                }
-            ],
-        },
-    ]
+    # Steps start as soon as the steps named in their parameters are done, so the downloads, user
+    # lookup and spoiler splitting overlap, and the DB insert overlaps with sharing the files.
+    pipeline = Pipeline()
+
+    @pipeline.step
+    async def uploads():
+        return await relay_files(files, client)
+
+    @pipeline.step
+    async def poster():
+        slack_user = await client.users_info(user=user_id)
+        display_name = (
+            slack_user.get("user", {}).get("profile", {}).get("display_name")
+            or slack_user.get("user", {}).get("real_name")
+            or "Unknown User"
+        )
+        pfp = slack_user.get("user", {}).get("profile", {}).get("image_512") or None
+        return display_name, pfp
+
+    @pipeline.step
+    async def variants():
+        return await run_cpu_bound(
+            split_spoilers_in_rich_text_blocks,
+            rich_text,
+            size=len(json.dumps(rich_text)),
+        )
+
+    # Waits for the uploads so that nothing is posted if a file can't be downloaded
+    @pipeline.step
+    async def message(uploads, poster, variants):
+        display_name, pfp = poster
+        _, redacted_blocks = variants
+        message_blocks = [
+            redacted_blocks,
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {
+                            "type": "plain_text",
+                            "text": "View spoiler",
+                            "emoji": True,
+                        },
+                        "action_id": "view_spoiler",
+                        "value": "db",
+                    }
+                ],
+            },
+        ]
+        return await client.chat_postMessage(
+            channel=channel,
+            blocks=message_blocks,
+            text="spoiler :hehe:",
+            username=display_name,
+            icon_url=pfp,
+            unfurl_media=True,
+            unfurl_links=True,
+            thread_ts=thread_ts,
+        )
+
+    @pipeline.step
+    async def record(message, variants):
+        bold_blocks, _ = variants
+        db_entry = Spoiler(
+            channel=channel, message_ts=message["ts"], message=bold_blocks, user=user_id
+        )
+        await Spoiler.insert(db_entry)
+        cache_spoiler_modal(channel, message["ts"], bold_blocks, user_id)
+
+    @pipeline.step
+    async def share(message, uploads):
+        if uploads:
+            await client.files_completeUploadExternal(
+                files=uploads,
+                channel_id=channel,
+                thread_ts=thread_ts,
+            )
 
-    user_id = body["user"]["id"]
-    slack_user = await client.users_info(user=user_id)
-    display_name = (
-        slack_user.get("user", {}).get("profile", {}).get("display_name")
-        or slack_user.get("user", {}).get("real_name")
-        or "Unknown User"
-    )
-    pfp = slack_user.get("user", {}).get("profile", {}).get("image_512") or None
-
-    msg = await client.chat_postMessage(
-        channel=channel,
-        blocks=message_blocks,
-        text="spoiler :hehe:",
-        username=display_name,
-        icon_url=pfp,
-        unfurl_media=True,
-        unfurl_links=True,
-        thread_ts=thread_ts,
-    )
-
-    db_entry = Spoiler(
-        channel=channel, message_ts=msg["ts"], message=bold_blocks, user=user_id
-    )
-    await Spoiler.insert(db_entry)
-    await client.files_upload_v2(
-        channel=channel,
-        file_uploads=files_to_upload,
-        thread_ts=thread_ts,
-    )
+    try:
+        await pipeline.run()
+    except FileRelayError as e:
+        await client.chat_postEphemeral(
+            channel=channel,
+            user=user_id,
+            text=f"i couldn't download the file {e.file['name']} :(\nplease try uploading it again!",
+        )
@@ -5,6 +5,7 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_extra.tables import MigrationChannel
 from slack_extra.tables import MigrationConfig
+from slack_extra.utils.channels import ensure_joined
 from slack_extra.utils.logging import send_heartbeat
 from slack_extra.utils.slack import is_channel_manager
 
@@ -51,7 +52,7 @@ async def setup_move_handler(ack: AsyncAck, body: dict, client: AsyncWebClient):
 
     for c in channels:
         try:
-            await client.conversations_join(channel=c)
+            await ensure_joined(c)
         except Exception as e:
             await send_heartbeat(f"Error joining channel {c} for user {user_id}: {e}")
             return await ack(
@@ -0,0 +1,94 @@
+import random
+
+# Text fragments that exercise markers: whole, split across elements, tripled and unbalanced
+_FRAGMENTS = [
+    "a",
+    "hello ",
+    "||",
+    "|",
+    "|||",
+    "||||",
+    " world",
+    "é",
+    "🙂",
+    "\n",
+    "x|y",
+    "",
+]
+
+
+def _text(rng: random.Random) -> dict:
+    el = {
+        "type": "text",
+        "text": "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 6))),
+    }
+    if rng.random() < 0.4:
+        el["style"] = {
+            k: True for k in rng.sample(["bold", "italic", "strike", "code"], 2)
+        }
+    if rng.random() < 0.1:
+        el["spoiler"] = True
+    return el
+
+
+def _inline(rng: random.Random) -> dict:
+    kind = rng.random()
+    if kind < 0.6:
+        return _text(rng)
+    if kind < 0.7:
+        return {"type": "emoji", "name": "smile"}
+    if kind < 0.8:
+        return {"type": "user", "user_id": "U123"}
+    if kind < 0.9:
+        return {"type": "link", "url": "https://example.com", "text": "ex||ample"}
+    return {"type": "channel", "channel_id": "C123"}
+
+
+def _section(rng: random.Random, kind: str = "rich_text_section") -> dict:
+    return {
+        "type": kind,
+        "elements": [_inline(rng) for _ in range(rng.randint(0, 8))],
+    }
+
+
+def random_rich_text(rng: random.Random) -> dict:
+    """A random rich_text block of the shapes Slack's rich text input produces."""
+    elements = []
+    for _ in range(rng.randint(1, 4)):
+        kind = rng.random()
+        if kind < 0.6:
+            elements.append(_section(rng))
+        elif kind < 0.75:
+            elements.append(_section(rng, "rich_text_preformatted"))
+        elif kind < 0.85:
+            elements.append(_section(rng, "rich_text_quote"))
+        else:
+            elements.append(
+                {
+                    "type": "rich_text_list",
+                    "style": "bullet",
+                    "elements": [_section(rng) for _ in range(rng.randint(1, 3))],
+                }
+            )
+    return {"type": "rich_text", "block_id": "b", "elements": elements}
+
+
+def large_rich_text(paragraphs: int) -> dict:
+    """A long message with a spoiler in every paragraph, for benchmarks."""
+    rng = random.Random(paragraphs)
+    elements = []
+    for i in range(paragraphs):
+        elements.append(
+            {
+                "type": "rich_text_section",
+                "elements": [
+                    {"type": "text", "text": f"paragraph {i}, with a ||hidden "},
+                    {"type": "emoji", "name": "eyes"},
+                    {"type": "text", "text": " part|", "style": {"italic": True}},
+                    {"type": "text", "text": "| and " + "filler " * rng.randint(5, 30)},
+                    {"type": "user", "user_id": "U123"},
+                    {"type": "text", "text": "\n"},
+                ],
+            }
+        )
+    return {"type": "rich_text", "block_id": "b", "elements": elements}
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_extra.utils.client import InstrumentedWebClient
+from slack_extra.utils.client import slack_error
+from slack_extra.utils.deadline import start_deadline
+
+
+@pytest.fixture
+def slow_slack(monkeypatch):
+    async def api_call(self, api_method, **kwargs):
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    monkeypatch.setattr(AsyncWebClient, "api_call", api_call)
+
+
+def test_expired_trigger_is_a_slack_error(slow_slack):
+    async def run():
+        start_deadline(0.05)
+        client = InstrumentedWebClient(token="xoxb-test")
+        with pytest.raises(SlackApiError) as e:
+            await client.views_open(trigger_id="123.456", view={})
+        return e.value
+
+    assert slack_error(asyncio.run(run())) == "expired_trigger_id"
+
+
+def test_deadline_leaves_other_methods_alone(slow_slack):
+    async def run():
+        start_deadline(0.05)
+        client = InstrumentedWebClient(token="xoxb-test")
+        return await client.chat_postMessage(channel="C123", text="hi")
+
+    assert asyncio.run(run()) == {"ok": True}
+
+
+def test_other_timeouts_pass_through(monkeypatch):
+    async def api_call(self, api_method, **kwargs):
+        raise TimeoutError
+
+    monkeypatch.setattr(AsyncWebClient, "api_call", api_call)
+
+    async def run():
+        start_deadline(5)
+        client = InstrumentedWebClient(token="xoxb-test")
+        await client.views_open(trigger_id="123.456", view={})
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
@@ -0,0 +1,151 @@
+import asyncio
+from urllib.parse import urlencode
+
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+from slack_extra.utils.lanes import LANES
+from slack_extra.utils.ratelimit import PriorityLimiter
+
+
+async def _hold(limiter: PriorityLimiter, lane: str, release: asyncio.Event):
+    async with limiter.slot(lane):
+        await release.wait()
+
+
+async def _saturate(limiter: PriorityLimiter, callers: int) -> list[asyncio.Task]:
+    release = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_hold(limiter, "bulk", release)) for _ in range(callers)
+    ]
+    await asyncio.sleep(0)
+    return release, tasks
+
+
+def test_interactive_uses_reserved_slots():
+    async def run():
+        limiter = PriorityLimiter(slots=32, reserved=8, lanes=LANES, max_wait=60)
+        release, tasks = await _saturate(limiter, 40)
+        async with asyncio.timeout(0.1):
+            async with limiter.slot("interactive"):
+                pass
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+
+def test_telemetry_is_not_starved():
+    async def run():
+        limiter = PriorityLimiter(slots=4, reserved=1, lanes=LANES, max_wait=0.2)
+        served = []
+
+        async def call(lane: str, name: str):
+            async with limiter.slot(lane):
+                served.append(name)
+                await asyncio.sleep(0.05)
+
+        # A steady stream of bulk calls that always has a queue
+        async def stream():
+            i = 0
+            while "telemetry" not in served:
+                asyncio.create_task(call("bulk", f"bulk{i}"))
+                i += 1
+                await asyncio.sleep(0.01)
+
+        streamer = asyncio.create_task(stream())
+        await asyncio.sleep(0.05)
+        async with asyncio.timeout(1):
+            await call("telemetry", "telemetry")
+        await streamer
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_leaves_no_trace():
+    async def run():
+        limiter = PriorityLimiter(slots=1, reserved=0, lanes=LANES, max_wait=60)
+        release, tasks = await _saturate(limiter, 1)
+        waiter = asyncio.create_task(_hold(limiter, "interactive", asyncio.Event()))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await asyncio.gather(*tasks)
+        async with asyncio.timeout(0.1):
+            async with limiter.slot("interactive"):
+                pass
+
+    asyncio.run(run())
+
+
+def test_commands_dispatch_while_limiter_is_saturated(monkeypatch):
+    from slack_extra import commands
+    from slack_extra.config import config
+    from slack_extra.env import env
+    from slack_extra.utils import client as client_module
+    from slack_extra.utils import logging as heartbeat_module
+    from slack_extra.utils.client import InstrumentedWebClient
+
+    async def run():
+        limiter = PriorityLimiter(slots=32, reserved=8, lanes=LANES, max_wait=60)
+        monkeypatch.setattr(client_module, "api_slots", limiter)
+        monkeypatch.setattr(config.slack, "heartbeat_channel", "C000HEARTBEAT")
+        monkeypatch.setattr(
+            env,
+            "slack_client",
+            InstrumentedWebClient(token="xoxb-test", base_url="http://127.0.0.1:9/"),
+            raising=False,
+        )
+        release, tasks = await _saturate(limiter, 40)
+
+        dispatched = asyncio.Event()
+
+        async def handler(ack, client, respond, performer):
+            dispatched.set()
+
+        love = next(cmd for cmd in commands.COMMANDS if cmd["name"] == "<3")
+        monkeypatch.setitem(love, "function", handler)
+
+        async def authorize(**kwargs):
+            return AuthorizeResult(
+                enterprise_id=None,
+                team_id="T000",
+                bot_token="xoxb-test",
+                bot_user_id="U000BOT",
+                bot_id="B000",
+            )
+
+        app = AsyncApp(
+            signing_secret="secret",
+            request_verification_enabled=False,
+            authorize=authorize,
+        )
+        commands.register_commands(app)
+        body = urlencode(
+            {
+                "command": "/se" if config.environment == "production" else "/dev-se",
+                "team_id": "T000",
+                "user_id": "U000USER",
+                "channel_id": "C000",
+                "text": "<3",
+                "trigger_id": "trigger",
+                "response_url": "http://127.0.0.1:9/respond",
+            }
+        )
+        await app.async_dispatch(
+            AsyncBoltRequest(
+                body=body,
+                headers={"content-type": ["application/x-www-form-urlencoded"]},
+            )
+        )
+        # The heartbeat is stuck behind bulk traffic; the command mustn't wait for it
+        async with asyncio.timeout(1):
+            await dispatched.wait()
+
+        for task in heartbeat_module._sending:
+            task.cancel()
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
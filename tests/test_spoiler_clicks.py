@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from slack_extra.utils import spoilers
+from slack_extra.utils.spoilers import ClickCounter
+
+
+def test_buffer_is_bounded():
+    counter = ClickCounter(max_pending=2)
+    for user in ("U1", "U2", "U3"):
+        counter.record("C1", "1.0", user)
+    # Existing entries still count up once the buffer is full
+    counter.record("C1", "1.0", "U1")
+    assert len(counter._pending) == 2
+    assert counter._pending[("C1", "1.0", "U1")][0] == 2
+
+
+def test_failed_flush_keeps_clicks_within_bound(monkeypatch):
+    async def fail(*args):
+        # Clicks keep arriving while the write is in flight
+        counter.record("C1", "1.0", "U3")
+        counter.record("C1", "1.0", "U4")
+        raise ConnectionError("database is down")
+
+    monkeypatch.setattr(spoilers.SpoilerClick, "raw", fail)
+    counter = ClickCounter(max_pending=3)
+    counter.record("C1", "1.0", "U1")
+    counter.record("C1", "1.0", "U2")
+    counter.record("C1", "1.0", "U2")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(counter.flush())
+    assert len(counter._pending) == 3
+    assert counter._pending[("C1", "1.0", "U1")][0] == 1
+    assert ("C1", "1.0", "U2") not in counter._pending
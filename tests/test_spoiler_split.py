@@ -0,0 +1,74 @@
+import json
+import random
+
+import pytest
+from legacy_spoiler_split import split_spoilers_in_rich_text_blocks as legacy_split
+from spoiler_payloads import large_rich_text
+from spoiler_payloads import random_rich_text
+
+from slack_extra.views.create_spoiler import split_spoilers_in_rich_text_blocks
+
+
+def _section(*elements) -> dict:
+    return {
+        "type": "rich_text",
+        "block_id": "b",
+        "elements": [{"type": "rich_text_section", "elements": list(elements)}],
+    }
+
+
+def _text(text: str, **style) -> dict:
+    el = {"type": "text", "text": text}
+    if style:
+        el["style"] = style
+    return el
+
+
+CASES = {
+    "plain": _section(_text("no spoilers here")),
+    "simple": _section(_text("this is a ||spoiler||.")),
+    "marker across elements": _section(
+        _text("a |"), _text("|b|", bold=True), _text("|c")
+    ),
+    "adjacent spoilers": _section(_text("||a||||b||")),
+    "unbalanced": _section(_text("||open but never closed")),
+    "triple pipes": _section(_text("|||x|||")),
+    "emoji inside": _section(
+        _text("see ||"), {"type": "emoji", "name": "eyes"}, _text(" this||")
+    ),
+    "emoji between pipes": _section(
+        _text("|"), {"type": "emoji", "name": "eyes"}, _text("|")
+    ),
+    "existing spoiler flag": _section({**_text("flagged"), "spoiler": True}),
+    "empty texts": _section(_text(""), _text("||"), _text(""), _text("||")),
+    "no text at all": _section({"type": "user", "user_id": "U1"}),
+    "block list": [_section(_text("||a||")), _section(_text("b"))],
+    "large": large_rich_text(200),
+}
+
+
+def _dump(result) -> str:
+    return json.dumps(result, sort_keys=False, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("payload", CASES.values(), ids=CASES.keys())
+def test_matches_legacy_splitter(payload):
+    assert _dump(split_spoilers_in_rich_text_blocks(payload)) == _dump(
+        legacy_split(payload)
+    )
+
+
+def test_matches_legacy_splitter_on_random_payloads():
+    rng = random.Random(2026)
+    for _ in range(2000):
+        payload = random_rich_text(rng)
+        assert _dump(split_spoilers_in_rich_text_blocks(payload)) == _dump(
+            legacy_split(payload)
+        ), payload
+
+
+def test_does_not_modify_input():
+    payload = large_rich_text(20)
+    before = json.dumps(payload)
+    split_spoilers_in_rich_text_blocks(payload)
+    assert json.dumps(payload) == before